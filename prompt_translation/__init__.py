@@ -0,0 +1,8 @@
+"""
+Translate skill/job catalogs and UI resource files with LLM APIs.
+
+Submodules are imported on demand; importing the package itself is cheap.
+Run `python -m prompt_translation --help` for the command line interface.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,207 @@
+import json
+import os
+import shutil
+import time
+import uuid
+
+from .profiling import span
+from .prompts import PROMPTS
+from .transport import DEFAULT_MODELS, get_client
+
+# --- Offline Batch Mode ---
+# Instead of one interactive request per chunk, every chunk request is
+# written to a JSONL file in the OpenAI/Groq batch format, submitted once and
+# polled until the provider has processed it. The result file is ingested
+# through the same parsers as streamed responses. Items missing from the
+# results are sent again in a smaller follow-up batch.
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+class ProviderBatchBackend:
+    """Submits batch files through the provider's Files and Batches APIs."""
+
+    def __init__(self, client, completion_window="24h"):
+        self.client = client
+        self.completion_window = completion_window
+
+    def submit(self, requests_file):
+        with open(requests_file, "rb") as f:
+            uploaded = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+        )
+        return batch.id
+
+    def status(self, batch_id):
+        batch = self.client.batches.retrieve(batch_id)
+        return batch.status
+
+    def download(self, batch_id, output_file):
+        """Writes the result (and error) lines of a finished batch to output_file. Returns False if there are none."""
+        batch = self.client.batches.retrieve(batch_id)
+        file_ids = [fid for fid in (batch.output_file_id, getattr(batch, "error_file_id", None)) if fid]
+        if not file_ids:
+            return False
+        with open(output_file, "wb") as out:
+            for file_id in file_ids:
+                out.write(self.client.files.content(file_id).read())
+        return True
+
+
+class LocalBatchBackend:
+    """
+    Local stand-in for the batch API: runs each request line through
+    client.chat.completions.create and writes the results in the provider's
+    output format. Useful for testing the batch flow without a provider batch
+    endpoint (e.g. with a fake client).
+    """
+
+    def __init__(self, client, work_dir="batches"):
+        self.client = client
+        self.work_dir = work_dir
+        self._batches = {}
+
+    def submit(self, requests_file):
+        batch_id = f"batch_local_{uuid.uuid4().hex[:12]}"
+        output_file = os.path.join(self.work_dir, f"{batch_id}_output.jsonl")
+        with open(requests_file, "r", encoding="utf-8") as src, open(output_file, "w", encoding="utf-8") as out:
+            for line in src:
+                request = json.loads(line)
+                result = {"id": f"req_{uuid.uuid4().hex[:12]}", "custom_id": request["custom_id"], "response": None, "error": None}
+                try:
+                    response = self.client.chat.completions.create(**request["body"])
+                    choice = response.choices[0]
+                    result["response"] = {
+                        "status_code": 200,
+                        "body": {"choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": choice.message.content},
+                            "finish_reason": choice.finish_reason,
+                        }]},
+                    }
+                except Exception as e:
+                    result["error"] = {"code": "request_failed", "message": str(e)}
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        self._batches[batch_id] = output_file
+        return batch_id
+
+    def status(self, batch_id):
+        return "completed" if batch_id in self._batches else "failed"
+
+    def download(self, batch_id, output_file):
+        shutil.copyfile(self._batches[batch_id], output_file)
+        return True
+
+
+def get_batch_backend(provider="groq", local=False, work_dir="batches"):
+    client = get_client(provider)
+    return LocalBatchBackend(client, work_dir) if local else ProviderBatchBackend(client)
+
+
+def write_batch_requests(chunks, kind, model, requests_file):
+    """
+    Writes one batch request line per chunk. Returns a dict mapping each
+    custom_id to the chunk's items, used to find what the results are missing.
+    """
+    spec = PROMPTS[kind]
+    manifest = {}
+    with open(requests_file, "w", encoding="utf-8") as f:
+        for idx, chunk in enumerate(chunks, start=1):
+            custom_id = f"chunk-{idx}"
+            request = {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": {"model": model, "messages": spec.messages(chunk), "temperature": spec.temperature},
+            }
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+            manifest[custom_id] = chunk
+    return manifest
+
+
+def ingest_batch_results(results_file, kind, manifest, on_item):
+    """
+    Parses every successful response in a batch result file with the kind's
+    parser and passes each item to on_item. Returns the items of the
+    manifest that got no answer, or an answer on_item rejected (returned False).
+    """
+    spec = PROMPTS[kind]
+    answered = set()
+    with open(results_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if result.get("error") or response.get("status_code") != 200:
+                print(f"Warning: batch request {result.get('custom_id')} failed: {result.get('error')}")
+                continue
+            choice = response["body"]["choices"][0]
+            content = choice["message"]["content"] or ""
+            # A response cut off at the token limit ends in a half-written item, which is dropped.
+            finish_reason = choice.get("finish_reason")
+            if finish_reason != "stop":
+                print(f"Warning: batch request {result.get('custom_id')} finished with {finish_reason}")
+            parser = spec.parser()
+            for source, translation in parser.feed(content) + parser.close(truncated=finish_reason != "stop"):
+                if on_item(source, translation) is not False:
+                    answered.add(source)
+
+    missing = []
+    for chunk in manifest.values():
+        missing.extend(item for item in chunk if spec.item_key(item) not in answered)
+    return missing
+
+
+def translate_in_batches(chunks, kind, on_item, provider="groq", model=None, backend=None, local=False,
+                         batch_dir="batches", poll_interval=30.0, max_rounds=3, chunk_size=None):
+    """
+    Translates all chunks through the batch API: writes the request file,
+    submits it, polls until it finishes and ingests the results. Items
+    without an answer are resubmitted, up to max_rounds batches in total.
+    With `local` the requests are run by LocalBatchBackend instead.
+
+    Request and result files are named after the kind and a run id, so jobs
+    sharing `batch_dir` (or reruns) never overwrite each other's files.
+    """
+    model = model or DEFAULT_MODELS[provider]
+    os.makedirs(batch_dir, exist_ok=True)
+    backend = backend or get_batch_backend(provider, local=local, work_dir=batch_dir)
+    run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+    pending = chunks
+    for round_no in range(1, max_rounds + 1):
+        requests_file = os.path.join(batch_dir, f"{kind}_{run_id}_round{round_no}_requests.jsonl")
+        with span("prompt", round=round_no):
+            manifest = write_batch_requests(pending, kind, model, requests_file)
+        if not manifest:
+            return
+        print(f"Batch round {round_no}: {len(manifest)} requests written to {requests_file}")
+
+        with span("request", round=round_no, requests=len(manifest)):
+            batch_id = backend.submit(requests_file)
+            print(f"Submitted batch {batch_id}")
+            status = backend.status(batch_id)
+            while status not in FINAL_STATUSES:
+                print(f"Batch {batch_id} is {status}; checking again in {poll_interval:.0f} s")
+                time.sleep(poll_interval)
+                status = backend.status(batch_id)
+            print(f"Batch {batch_id} finished with status: {status}")
+
+        results_file = os.path.join(batch_dir, f"{kind}_{run_id}_round{round_no}_results.jsonl")
+        if not backend.download(batch_id, results_file):
+            print(f"Warning: batch {batch_id} produced no result file.")
+            missing = [item for chunk in manifest.values() for item in chunk]
+        else:
+            with span("parse", round=round_no):
+                missing = ingest_batch_results(results_file, kind, manifest, on_item)
+        if not missing:
+            return
+        print(f"{len(missing)} items without an answer.")
+        size = chunk_size or max(len(chunk) for chunk in manifest.values())
+        pending = [missing[i:i + size] for i in range(0, len(missing), size)]
+    print(f"Giving up on {len(missing)} items after {max_rounds} batch rounds.")
@@ -0,0 +1,94 @@
+import re
+
+import pandas as pd
+
+from .engine import chunk_list, translate_chunks
+from .prompts import LINE_KINDS
+from .qa import load_glossary, looks_like_term, run_checks
+from .transport import SMALL_MODELS
+
+# --- Cheap-Model-First Cascade ---
+# Most catalog items ("cooking", "Cashier") are easy enough for a small, fast
+# model with a high rate limit. The cascade sends them there first and checks
+# every answer with the QA screen. Items the small model left blank or got
+# wrong, plus items that look hard from the start, are then translated by the
+# large model. Only the escalated items pay large-model prices and rate limits.
+
+# Items with more words than this, or with any of these characters, go straight to the large model
+DIFFICULT_WORDS = 4
+DIFFICULT_CHARS = re.compile(r"[/()&,;:]")
+
+
+def is_difficult(text):
+    """Difficulty heuristic: long, compound or qualified items ("Sales & Marketing (B2B)")."""
+    text = str(text)
+    return len(text.split()) > DIFFICULT_WORDS or bool(DIFFICULT_CHARS.search(text))
+
+
+def translate_cascade(chunks, kind, on_item, provider="groq", model=None, small_provider=None, small_model=None,
+                      small_interval=None, interval=5.0, on_chunk_done=None, client=None, language="tr", **options):
+    """
+    Translates the items of `chunks` with `small_model` first and escalates to
+    `model` (the provider's default large model if not given) every item that
+    came back blank, failed a QA check or matches is_difficult(). Accepted and
+    escalated translations are both passed to on_item. Other options (e.g.
+    hedge_options) are passed to both translate_chunks passes.
+    """
+    if kind not in LINE_KINDS:
+        raise ValueError(f"Cascade mode supports the {', '.join(LINE_KINDS)} kinds only, not {kind}")
+    if options.get("batch_options") is not None:
+        raise ValueError("Cascade mode checks every chunk as it finishes and cannot run through the batch API")
+    small_provider = small_provider or provider
+    small_model = small_model or SMALL_MODELS[small_provider]
+    small_interval = interval if small_interval is None else small_interval
+    glossary = load_glossary()
+
+    chunks = list(chunks)
+    chunk_size = max((len(chunk) for chunk in chunks), default=1)
+    items = [item for chunk in chunks for item in chunk]
+    easy = [item for item in items if not is_difficult(item)]
+    escalate = [item for item in items if is_difficult(item)]
+    print(f"Cascade: {len(easy)} items for {small_model}, {len(escalate)} straight to the large model.")
+
+    # --- Pass 1: Small Model, Checked Chunk by Chunk ---
+    drafts = {}
+    accepted = 0
+    reasons = pd.Series(dtype="int64")  # failed checks per QA check name
+    pending = iter(chunk_list(easy, chunk_size))
+
+    def check_chunk(idx):
+        nonlocal accepted, reasons
+        chunk = next(pending)
+        df = pd.DataFrame({"source": chunk, "target": [drafts.pop(item, "") for item in chunk]})
+        checks = run_checks(df, "source", "target", language, glossary)
+        # A copied draft is only kept for glossary terms and acronyms ("SQL", "Microsoft Excel");
+        # everything else the small model echoed goes to the large model.
+        copied = df["target"].str.strip().str.casefold().eq(df["source"].str.strip().str.casefold())
+        checks["copied_source"] = copied & ~looks_like_term(df["source"].str.strip(), glossary, strict=True)
+        reasons = reasons.add(checks.sum(), fill_value=0)
+        flagged = checks.any(axis=1)
+        for source, target, bad in zip(df["source"], df["target"], flagged):
+            if bad:
+                escalate.append(source)
+            else:
+                on_item(source, target)
+                accepted += 1
+        if on_chunk_done:
+            on_chunk_done(idx)
+
+    # Items the small model skips are escalated instead of being retried on it.
+    translate_chunks(
+        list(chunk_list(easy, chunk_size)), kind, drafts.__setitem__,
+        provider=small_provider, model=small_model, interval=small_interval,
+        max_attempts=1, on_chunk_done=check_chunk, client=client if small_provider == provider else None, **options
+    )
+    print(f"Cascade: {accepted} items accepted from {small_model}, {len(escalate)} escalated.")
+    if reasons.any():
+        print("Cascade: failed checks: " + ", ".join(f"{name} {int(count)}" for name, count in reasons.items() if count))
+
+    # --- Pass 2: Large Model for Escalated Items ---
+    if escalate:
+        translate_chunks(
+            list(chunk_list(escalate, chunk_size)), kind, on_item,
+            provider=provider, model=model, interval=interval, on_chunk_done=on_chunk_done, client=client, **options
+        )
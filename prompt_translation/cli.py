@@ -0,0 +1,264 @@
+import argparse
+import sys
+
+# Subcommand handlers import their modules lazily, so quick commands (and
+# `--help`) never load pandas, groq, openai or httpx unless they need them.
+
+
+def _add_provider_arguments(parser):
+    parser.add_argument("--provider", choices=["groq", "openrouter"], default="groq", help="API provider")
+    parser.add_argument("--model", help="Model name (defaults to the provider's default model)")
+    parser.add_argument("--chunk-size", type=int, help="Items per API call")
+    parser.add_argument("--interval", type=float, help="Minimum seconds between requests (rate limit)")
+    parser.add_argument("--batch", action="store_true", help="Use the offline batch API instead of interactive requests")
+    parser.add_argument("--batch-local", action="store_true", help="Run the batch file locally (stand-in for testing)")
+    parser.add_argument("--batch-dir", default="batches", help="Folder for batch request and result files")
+    parser.add_argument("--poll-interval", type=float, default=30.0, help="Seconds between batch status checks")
+    parser.add_argument("--hedge-percentile", type=float,
+                        help="Duplicate a chunk request still running after this latency percentile (e.g. 95)")
+    parser.add_argument("--hedge-provider", choices=["groq", "openrouter"], help="Provider for hedge requests (default: same)")
+    parser.add_argument("--hedge-model", help="Model for hedge requests (default: same model)")
+    parser.add_argument("--hedge-budget", type=float, default=0.1, help="Largest fraction of requests that may be hedged")
+
+
+def _batch_options(args):
+    if not (args.batch or args.batch_local):
+        return None
+    if args.batch and not args.batch_local and args.provider == "openrouter":
+        raise ValueError("OpenRouter has no batch API; use --provider groq for --batch (or --batch-local)")
+    return {
+        "local": args.batch_local,
+        "batch_dir": args.batch_dir,
+        "poll_interval": args.poll_interval,
+    }
+
+
+def _hedge_options(args):
+    if args.hedge_percentile is None:
+        return None
+    return {
+        "percentile": args.hedge_percentile,
+        "provider": args.hedge_provider,
+        "model": args.hedge_model,
+        "budget": args.hedge_budget,
+    }
+
+
+def _cascade_options(args):
+    if not args.cascade:
+        return None
+    return {
+        "small_provider": args.small_provider,
+        "small_model": args.small_model,
+        "small_interval": args.small_interval,
+    }
+
+
+def _run_table(args):
+    from .tabular import translate_table
+
+    translate_table(
+        args.input, args.output,
+        kind=args.kind,
+        column=args.column,
+        target_column=args.target_column,
+        columns=args.columns,
+        target_columns=args.target_columns,
+        chunk_size=args.chunk_size,
+        interval=args.interval,
+        provider=args.provider,
+        model=args.model,
+        checkpoint=args.checkpoint,
+        progress_filename=args.progress_file,
+        cascade_options=_cascade_options(args),
+        batch_options=_batch_options(args),
+        hedge_options=_hedge_options(args),
+    )
+
+
+def _run_json(args):
+    from .json_resources import translate_nested_json
+
+    translate_nested_json(
+        args.input, args.output,
+        language=args.language,
+        chunk_size=args.chunk_size or 50,
+        interval=5.0 if args.interval is None else args.interval,
+        provider=args.provider,
+        model=args.model,
+        store_file=args.store,
+        batch_options=_batch_options(args),
+        hedge_options=_hedge_options(args),
+    )
+
+
+def _run_backend_json(args):
+    from .json_resources import translate_backend_json
+
+    translate_backend_json(
+        args.input, args.output,
+        chunk_size=args.chunk_size or 50,
+        interval=5.0 if args.interval is None else args.interval,
+        provider=args.provider,
+        model=args.model,
+        store_file=args.store,
+        batch_options=_batch_options(args),
+        hedge_options=_hedge_options(args),
+    )
+
+
+def _run_stats(args):
+    from .stats import process_file
+
+    for filename in args.files:
+        process_file(filename, text_column=args.column)
+
+
+def _run_merge(args):
+    from .merge import merge_csv_files
+
+    merge_csv_files(args.folder, args.output)
+
+
+def _run_qa(args):
+    from .qa import apply_retranslations, qa_file
+
+    if args.apply:
+        apply_retranslations(args.input, args.apply, args.source_column, args.target_column)
+    qa_file(args.input, args.source_column, args.target_column, args.language, args.glossary)
+
+
+def _run_serve(args):
+    from .server import serve
+
+    serve(
+        args.host, args.port,
+        provider=args.provider,
+        model=args.model,
+        batch_size=args.batch_size,
+        window=args.window_ms / 1000,
+        max_in_flight=args.max_in_flight,
+        requests_per_minute=args.rpm,
+        verbose=args.verbose,
+    )
+
+
+def _run_schedule(args):
+    from .scheduler import run_jobs
+
+    failed = run_jobs(args.jobs_file, provider=args.provider, model=args.model)
+    if failed:
+        print(f"Failed jobs: {', '.join(failed)}", file=sys.stderr)
+        return 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="prompt-translation",
+        description="Translate skill/job catalogs and UI resource files with LLM APIs.",
+    )
+    parser.add_argument("--trace", metavar="FILE",
+                        help="Record stage timings and write them as a Chrome trace (chrome://tracing, Perfetto)")
+    parser.add_argument("--profile", metavar="FILE", help="Run under cProfile and dump the stats to FILE")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # --- csv / xlsx: translate one column (or, with --columns, several) of a table ---
+    for name, reader in [("csv", "CSV"), ("xlsx", "Excel")]:
+        p = subparsers.add_parser(name, help=f"Translate a column of a {reader} file, writing a CSV")
+        p.add_argument("input", help=f"{reader} file to translate")
+        p.add_argument("output", help="CSV file to write")
+        p.add_argument("--kind", choices=["skills", "jobs", "descriptions"], default="skills" if name == "csv" else "jobs",
+                       help="Prompt to use (also selects default columns, chunk size and interval); "
+                            "descriptions are split into sentences and reassembled")
+        p.add_argument("--column", help="Source column (default: Skill / Job Titles_En / Description)")
+        p.add_argument("--target-column",
+                       help="Column for translations (default: Turkce_Skill / Turkce_Meslek / Turkce_Aciklama)")
+        p.add_argument("--columns", nargs="+", metavar="COLUMN",
+                       help="Translate several columns, sending all fields of a row in one item")
+        p.add_argument("--target-columns", nargs="+", metavar="COLUMN",
+                       help="Columns for the --columns translations (default: Turkce_<column>)")
+        p.add_argument("--checkpoint", action="store_true", help="Rewrite the output CSV after every chunk")
+        p.add_argument("--progress-file", help="Append every translation to this CSV as it streams in")
+        p.add_argument("--cascade", action="store_true",
+                       help="Translate with a small fast model first and escalate blank, failed or hard items to --model")
+        p.add_argument("--small-provider", choices=["groq", "openrouter"], help="Provider of the small model (default: --provider)")
+        p.add_argument("--small-model", help="Small model for the cascade (default: llama-3.1-8b-instant on Groq)")
+        p.add_argument("--small-interval", type=float, help="Seconds between small-model requests (default: --interval)")
+        _add_provider_arguments(p)
+        p.set_defaults(func=_run_table)
+
+    # --- json: nested UI strings ---
+    p = subparsers.add_parser("json", help="Translate a nested Turkish UI JSON file")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("--language", choices=["en", "az"], default="en", help="Target language")
+    p.add_argument("--store", help="SQLite file that keeps translations between runs (resumes where it stopped)")
+    _add_provider_arguments(p)
+    p.set_defaults(func=_run_json)
+
+    # --- backend-json: {"data": [{"_name": ..., "value": ...}]} resources ---
+    p = subparsers.add_parser("backend-json", help="Translate a backend resource JSON file into English")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("--store", help="SQLite file that keeps translations between runs (resumes where it stopped)")
+    _add_provider_arguments(p)
+    p.set_defaults(func=_run_backend_json)
+
+    # --- stats: letter / word counts ---
+    p = subparsers.add_parser("stats", help="Count letters and words in a column of CSV/Excel files")
+    p.add_argument("files", nargs="+")
+    p.add_argument("--column", default="Skill", help="Text column to count")
+    p.set_defaults(func=_run_stats)
+
+    # --- merge: combine translated parts ---
+    p = subparsers.add_parser("merge", help="Merge all CSV files of a folder in natural order")
+    p.add_argument("folder", nargs="?", default="docs_translated")
+    p.add_argument("output", nargs="?", default="merged_jobs.csv")
+    p.set_defaults(func=_run_merge)
+
+    # --- qa: flag suspicious translations ---
+    p = subparsers.add_parser("qa", help="Flag suspicious translations and write a re-translation queue")
+    p.add_argument("input")
+    p.add_argument("--source-column", default="Skill")
+    p.add_argument("--target-column", default="Turkce_Skill")
+    p.add_argument("--language", choices=["tr", "az"], default="tr")
+    p.add_argument("--glossary", help="File of terms that may stay untranslated, one per line")
+    p.add_argument("--apply", metavar="RETRANSLATED_CSV",
+                   help="First write the translations of a re-translation run back into the input table")
+    p.set_defaults(func=_run_qa)
+
+    # --- serve: local translation service ---
+    p = subparsers.add_parser("serve", help="Run the local translation service with request micro-batching")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--provider", choices=["groq", "openrouter"], default="groq")
+    p.add_argument("--model")
+    p.add_argument("--batch-size", type=int, default=50, help="Maximum texts per model request")
+    p.add_argument("--window-ms", type=float, default=50, help="How long to wait for a batch to fill")
+    p.add_argument("--max-in-flight", type=int, default=4, help="Concurrent model requests")
+    p.add_argument("--rpm", type=float, default=30, help="Provider requests per minute")
+    p.add_argument("--verbose", action="store_true", help="Log every HTTP request")
+    p.set_defaults(func=_run_serve)
+
+    # --- schedule: several jobs sharing one provider quota ---
+    p = subparsers.add_parser("schedule", help="Run the jobs of a JSON job file concurrently under one shared rate limit")
+    p.add_argument("jobs_file", help="JSON file with the quota settings and a list of jobs")
+    p.add_argument("--provider", choices=["groq", "openrouter"], help="API provider (overrides the job file)")
+    p.add_argument("--model", help="Default model for jobs that do not set one")
+    p.set_defaults(func=_run_schedule)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        if args.trace or args.profile:
+            from .profiling import capture
+
+            with capture(args.trace, args.profile):
+                return args.func(args) or 0
+        return args.func(args) or 0
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,101 @@
+import time
+from itertools import islice
+
+from .profiling import span
+from .prompts import PROMPTS
+from .streaming import ChunkQueue, stream_translations
+from .transport import DEFAULT_MODELS, get_client
+
+
+def chunk_list(lst, chunk_size):
+    """Splits the list into chunks of size chunk_size."""
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
+
+
+def iter_chunks(iterable, chunk_size):
+    """Lazily groups any iterable into lists of up to chunk_size items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def translate_chunks(chunks, kind, on_item, provider="groq", model=None, interval=5.0,
+                     max_attempts=3, on_chunk_done=None, client=None, batch_options=None, scheduler=None,
+                     hedge_options=None, cascade_options=None):
+    """
+    Sends every chunk (a list, or a lazy iterator of lists) to the model with
+    the prompt for `kind`, streaming the answers and passing each
+    (source, translation) pair to on_item as soon as it is parsed. Items the
+    model skipped are re-queued up to max_attempts.
+
+    `interval` is the minimum number of seconds between request starts (the
+    provider rate limit); on_chunk_done(index) runs after every request.
+
+    With `batch_options` (a dict, possibly empty) all chunks are sent through
+    the offline batch API instead; see batch.translate_in_batches.
+
+    With `scheduler` (a job from scheduler.FairScheduler) requests wait for
+    the job's turn in the shared provider quota instead of `interval`.
+
+    With `hedge_options` (a dict, possibly empty) slow chunks are duplicated
+    to a second model or endpoint; see hedging.Hedger. It cannot be combined
+    with `batch_options` or `scheduler`.
+
+    With `cascade_options` (a dict, possibly empty) a small model translates
+    first and only failed or hard items go to `model`; see
+    cascade.translate_cascade.
+    """
+    if cascade_options is not None:
+        from .cascade import translate_cascade
+        return translate_cascade(
+            chunks, kind, on_item, provider=provider, model=model, interval=interval,
+            on_chunk_done=on_chunk_done, client=client, batch_options=batch_options,
+            scheduler=scheduler, hedge_options=hedge_options, **cascade_options
+        )
+    if hedge_options is not None and (batch_options is not None or scheduler is not None):
+        raise ValueError("Hedging applies to interactive requests only, not to batch mode or scheduled jobs")
+    if batch_options is not None:
+        from .batch import translate_in_batches
+        return translate_in_batches(chunks, kind, on_item, provider=provider, model=model, **batch_options)
+
+    spec = PROMPTS[kind]
+    client = client or get_client(provider)
+    model = model or DEFAULT_MODELS[provider]
+    if scheduler is not None:
+        return scheduler.run(chunks, kind, on_item, client, model, max_attempts=max_attempts, on_chunk_done=on_chunk_done)
+
+    queue = ChunkQueue(chunks, key=spec.item_key, max_attempts=max_attempts)
+    hedger = None
+    if hedge_options is not None:
+        from .hedging import Hedger
+        hedger = Hedger(client, model, **hedge_options)
+
+    for idx, chunk in enumerate(queue, start=1):
+        start_time = time.time()
+        print(f"Translating chunk {idx}/{queue.total}…" if queue.total else f"Translating chunk {idx}…")
+        with span("prompt", chunk=idx):
+            messages = spec.messages(chunk)
+        request = dict(
+            expected_keys=queue.keys(chunk),
+            on_item=on_item,
+            on_missing=queue.report_missing,
+            messages=messages,
+            temperature=spec.temperature
+        )
+        requests_sent = 1
+        with span("request", chunk=idx, items=len(chunk)):
+            if hedger:
+                hedges_before = hedger.budget.hedges
+                hedger.stream_translations(spec.parser, **request)
+                requests_sent += hedger.budget.hedges - hedges_before
+            else:
+                stream_translations(client, spec.parser(), model=model, **request)
+        # Respect API rate limits: wait out the rest of the interval (once per request sent, hedges included)
+        elapsed = time.time() - start_time
+        time.sleep(max(interval * requests_sent - elapsed, 0))
+        if on_chunk_done:
+            on_chunk_done(idx)
@@ -0,0 +1,169 @@
+import queue
+import threading
+import time
+from collections import deque
+
+from .streaming import stream_translations
+from .transport import DEFAULT_MODELS, get_client
+
+# --- Hedged Requests ---
+# A chunk request that has not finished by the p-th percentile of recent
+# request latencies gets a duplicate sent to a second model or endpoint. Both
+# responses stream into the same chunk: every item is committed once, from
+# whichever response delivers it first, and the first response that finishes
+# cleanly wins; the other one is cancelled (its stream is closed right away,
+# even if it is stalled). A budget caps how many requests may be duplicated,
+# so the extra spend stays bounded. Each hedge counts as one more request
+# against the `interval` of translate_chunks.
+#
+# Hedge requests do not go through a FairScheduler; hedging applies to the
+# interactive loop only.
+
+
+class LatencyTracker:
+    """Keeps the latencies of the last `window` requests and answers percentile queries."""
+
+    def __init__(self, window=100, min_samples=5):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds):
+        self._samples.append(seconds)
+
+    def percentile(self, p):
+        """Latency below which `p` percent of the recorded requests finished, or None with too few samples."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * p / 100))
+        return ordered[index]
+
+
+class HedgeBudget:
+    """Allows a hedge only while hedges stay within `max_fraction` of all requests sent."""
+
+    def __init__(self, max_fraction=0.1):
+        self.max_fraction = max_fraction
+        self.requests = 0
+        self.hedges = 0
+
+    def record_request(self):
+        self.requests += 1
+
+    def allow(self):
+        if self.hedges + 1 > self.max_fraction * self.requests:
+            return False
+        self.hedges += 1
+        return True
+
+
+class _Attempt:
+    """One request of a hedged chunk, running in its own thread; cancel() closes its stream from any thread."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.stream = None
+
+    def opened(self, stream):
+        self.stream = stream
+        if self.event.is_set():
+            self.cancel()
+
+    def cancel(self):
+        self.event.set()
+        # Closing the response unblocks a stalled read and frees its pooled connection.
+        if self.stream is not None and hasattr(self.stream, "close"):
+            try:
+                self.stream.close()
+            except Exception:
+                pass
+
+
+class Hedger:
+    """
+    Sends chunk requests like stream_translations, duplicating the slow ones.
+
+    `percentile` sets the hedge delay from the observed latencies (no hedging
+    until `min_samples` requests have finished); the duplicate goes to
+    `model` on `provider`, by default the same model on a separate request.
+    `budget` is the largest fraction of requests that may be duplicated.
+    """
+
+    def __init__(self, primary_client, primary_model, percentile=95.0, provider=None, model=None,
+                 budget=0.1, min_samples=5):
+        self.primary_client = primary_client
+        self.primary_model = primary_model
+        self.percentile = percentile
+        self.hedge_client = get_client(provider) if provider else primary_client
+        self.hedge_model = model or (DEFAULT_MODELS[provider] if provider else primary_model)
+        self.latencies = LatencyTracker(min_samples=min_samples)
+        self.budget = HedgeBudget(budget)
+
+    def _start(self, index, events, parser_factory, client, request_kwargs):
+        attempt = _Attempt()
+
+        def run():
+            _, finish_reason = stream_translations(
+                client, parser_factory(),
+                on_item=lambda source, translation: events.put(("item", index, (source, translation))),
+                cancel=attempt.event,
+                on_stream=attempt.opened,
+                **request_kwargs
+            )
+            events.put(("done", index, finish_reason))
+
+        threading.Thread(target=run, daemon=True).start()
+        self.budget.record_request()
+        return attempt
+
+    def stream_translations(self, parser_factory, expected_keys=(), on_item=None, on_missing=None, **request_kwargs):
+        """
+        Same contract as streaming.stream_translations, except that the parser
+        is given as a factory (each attempt needs its own). on_item and
+        on_missing are called from the calling thread.
+        """
+        events = queue.Queue()
+        start_time = time.time()
+        attempts = [self._start(0, events, parser_factory, self.primary_client,
+                               dict(request_kwargs, model=self.primary_model))]
+        hedge_after = self.latencies.percentile(self.percentile)
+        translations = {}
+        finished = {}
+        winner = None
+
+        while winner is None:
+            timeout = None
+            if hedge_after is not None and len(attempts) == 1:
+                timeout = max(start_time + hedge_after - time.time(), 0)
+            try:
+                kind, index, payload = events.get(timeout=timeout)
+            except queue.Empty:
+                if self.budget.allow():
+                    print(f"Chunk still running after {hedge_after:.1f} s; hedging with {self.hedge_model}")
+                    attempts.append(self._start(1, events, parser_factory, self.hedge_client,
+                                               dict(request_kwargs, model=self.hedge_model)))
+                hedge_after = None
+                continue
+
+            if kind == "item":
+                source, translation = payload
+                if source not in translations and (not on_item or on_item(source, translation) is not False):
+                    translations[source] = translation
+                continue
+
+            finished[index] = payload
+            # A clean finish wins; otherwise wait for the other attempt, if any is still running.
+            if payload == "stop" or len(finished) == len(attempts):
+                winner = index
+                if len(attempts) > 1:
+                    print(f"{'Hedge' if index else 'Primary'} request won ({payload}).")
+
+        for index, attempt in enumerate(attempts):
+            if index != winner:
+                attempt.cancel()
+        self.latencies.record(time.time() - start_time)
+
+        for key in dict.fromkeys(expected_keys):
+            if key not in translations and on_missing:
+                on_missing(key)
+        return translations, finished[winner]
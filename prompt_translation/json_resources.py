@@ -0,0 +1,216 @@
+import os
+import tempfile
+
+from .engine import iter_chunks, translate_chunks
+from .json_stream import (
+    END_ARRAY, END_MAP, KEY, START_ARRAY, START_MAP, VALUE,
+    JsonEventReader, JsonEventWriter, TranslationStore, materialize,
+)
+from .profiling import span, traced_iter
+
+# Both resource formats are processed in two streaming passes over the input:
+# the first reads entries lazily and feeds them to the model chunk by chunk,
+# storing translations on disk; the second copies the input event by event,
+# replacing the translated strings. Memory use stays bounded by the chunk
+# size and the read buffer, whatever the size of the file.
+
+# Prompt kind for each target language of the nested UI JSON files
+UI_LANGUAGES = {
+    "en": "ui-en",
+    "az": "ui-az",
+}
+
+# Event emitted by _backend_events for a materialized element of the "data" array
+ITEM = "item"
+
+
+def _open_store(store_file):
+    """Opens the translation store, in a temporary file unless one is given."""
+    if store_file:
+        return TranslationStore(store_file), None
+    fd, path = tempfile.mkstemp(suffix=".sqlite3")
+    os.close(fd)
+    return TranslationStore(path), path
+
+
+def _close_store(store, temp_path):
+    store.close()
+    if temp_path:
+        os.remove(temp_path)
+
+
+# --- Nested UI JSON (e.g. translation.json) ---
+def _events_with_paths(events):
+    """
+    Passes the JSON events through, adding the key path (a tuple, so keys
+    containing dots stay intact) to every string reachable through object
+    keys only; other events get None.
+    """
+    stack = []  # [is_map, current_key] per open container
+    for event, value in events:
+        path = None
+        if event == KEY:
+            stack[-1][1] = value
+        elif event == START_MAP or event == START_ARRAY:
+            stack.append([event == START_MAP, None])
+        elif event == END_MAP or event == END_ARRAY:
+            stack.pop()
+        elif isinstance(value, str) and stack and all(is_map for is_map, _ in stack):
+            path = tuple(key for _, key in stack)
+        yield event, value, path
+
+
+def iter_string_leaves(input_file):
+    """Lazily yields (path, text) for every string of a nested JSON file, in file order."""
+    with open(input_file, "r", encoding="utf-8") as f:
+        for _, value, path in _events_with_paths(JsonEventReader(f)):
+            if path is not None:
+                yield path, value
+
+
+def patch_string_leaves(input_file, output_file, lookup):
+    """
+    Streams `input_file` to `output_file`, replacing each string leaf with
+    lookup(path) unless that returns None. Key order and every other value
+    are kept as they are.
+    """
+    with open(input_file, "r", encoding="utf-8") as src, open(output_file, "w", encoding="utf-8") as dst:
+        writer = JsonEventWriter(dst)
+        for event, value, path in _events_with_paths(JsonEventReader(src)):
+            if path is not None:
+                translated = lookup(path)
+                if translated is not None:
+                    value = translated
+            writer.event(event, value)
+
+
+def translate_nested_json(input_file, output_file, language="en", chunk_size=50, interval=5.0,
+                          provider="groq", model=None, store_file=None, batch_options=None, scheduler=None,
+                          hedge_options=None):
+    """
+    Translates every string of a nested Turkish UI JSON file into `language`
+    ("en" or "az") and writes the result to `output_file` with the same
+    structure. Strings that could not be translated keep their source text.
+
+    With `store_file` translations are kept in that SQLite file, and strings
+    already translated by an earlier run are skipped. `batch_options`
+    switches to the offline batch API; `scheduler` runs the requests as a job
+    of a shared FairScheduler; `hedge_options` duplicates slow requests.
+    """
+    store, temp_path = _open_store(store_file)
+    # The model answers with dotted paths; map them back to the real key tuples.
+    outstanding = {}
+
+    def prompt_entries():
+        for path, text in traced_iter("read", iter_string_leaves(input_file)):
+            if path in store:
+                continue
+            key = ".".join(path)
+            suffix = 1
+            while key in outstanding and outstanding[key] != path:
+                suffix += 1
+                key = f"{'.'.join(path)}#{suffix}"
+            outstanding[key] = path
+            yield key, text
+
+    def commit(key, translation):
+        path = outstanding.pop(key, None)
+        if path is not None:
+            store.put(path, translation)
+
+    try:
+        translate_chunks(
+            iter_chunks(prompt_entries(), chunk_size), UI_LANGUAGES[language], commit,
+            provider=provider, model=model, interval=interval,
+            on_chunk_done=lambda idx: store.commit(),
+            batch_options=batch_options,
+            scheduler=scheduler,
+            hedge_options=hedge_options,
+        )
+        store.commit()
+        with span("write", file=output_file):
+            patch_string_leaves(input_file, output_file, store.get)
+        print(f"✅ Translated JSON saved to {output_file}")
+        print(f"Total entries translated: {len(store)}")
+    finally:
+        _close_store(store, temp_path)
+
+
+# --- Backend resource JSON (e.g. source_data_backend.json) ---
+def _backend_events(events):
+    """
+    Passes the JSON events through, except that each element of the top-level
+    "data" array is read whole and yielded as (ITEM, element).
+    """
+    events = iter(events)
+    depth = 0
+    top_key = None
+    in_data = False
+    for event, value in events:
+        if in_data and depth == 2 and event in (START_MAP, START_ARRAY, VALUE):
+            yield ITEM, materialize(events, event, value)
+            continue
+        if event == KEY and depth == 1:
+            top_key = value
+        elif event == START_MAP or event == START_ARRAY:
+            depth += 1
+            in_data = depth == 2 and event == START_ARRAY and top_key == "data"
+        elif event == END_MAP or event == END_ARRAY:
+            depth -= 1
+            in_data = False
+        yield event, value
+
+
+def iter_backend_entries(input_file):
+    """Lazily yields (_name, value) for every item of the "data" list that has a string value."""
+    with open(input_file, "r", encoding="utf-8") as f:
+        for event, item in _backend_events(JsonEventReader(f)):
+            if event != ITEM or not isinstance(item, dict):
+                continue
+            key = item.get("_name")
+            text = item.get("value")
+            if key and isinstance(text, str):
+                yield key, text
+
+
+def translate_backend_json(input_file, output_file, chunk_size=50, interval=5.0, provider="groq", model=None,
+                           store_file=None, batch_options=None, scheduler=None, hedge_options=None):
+    """
+    Translates the "value" of every item in the "data" list of a backend
+    resource file (keyed by "_name") and writes the patched file.
+    """
+    store, temp_path = _open_store(store_file)
+
+    def pending_entries():
+        for key, text in traced_iter("read", iter_backend_entries(input_file)):
+            if key not in store:
+                yield key, text
+
+    try:
+        translate_chunks(
+            iter_chunks(pending_entries(), chunk_size), "backend-en", store.put,
+            provider=provider, model=model, interval=interval,
+            on_chunk_done=lambda idx: store.commit(),
+            batch_options=batch_options,
+            scheduler=scheduler,
+            hedge_options=hedge_options,
+        )
+        store.commit()
+        print(f"Total entries translated: {len(store)}")
+
+        # Inject translations back into the items while copying the file
+        with span("write", file=output_file), \
+                open(input_file, "r", encoding="utf-8") as src, open(output_file, "w", encoding="utf-8") as dst:
+            writer = JsonEventWriter(dst)
+            for event, value in _backend_events(JsonEventReader(src)):
+                if event == ITEM:
+                    if isinstance(value, dict):
+                        translated = store.get(value.get("_name"))
+                        if translated is not None:
+                            value["value"] = translated
+                    writer.value(value)
+                else:
+                    writer.event(event, value)
+        print(f"✅ Translated JSON saved to {output_file}")
+    finally:
+        _close_store(store, temp_path)
@@ -0,0 +1,221 @@
+import json
+import re
+import sqlite3
+
+# --- Streaming JSON Reading and Writing ---
+# Large resource bundles are never loaded whole: JsonEventReader turns a file
+# into a flat stream of events read in fixed-size blocks, and JsonEventWriter
+# writes the same events back out with json.dump(indent=2)-style formatting.
+# Keys are kept exactly as they are (including dots) and in their original order.
+
+START_MAP, KEY, END_MAP, START_ARRAY, END_ARRAY, VALUE = (
+    "start_map", "key", "end_map", "start_array", "end_array", "value"
+)
+
+_SKIP = re.compile(r"[\s,:]*")
+_SCALAR = re.compile(r"[^\s,:\]}]*")
+
+
+class JsonEventReader:
+    """
+    Iterates over (event, value) pairs of a JSON document read from a text file
+    object in blocks of `block_size` characters, so memory use is bounded by the
+    block size plus the longest single string in the file.
+    """
+
+    def __init__(self, f, block_size=1 << 16):
+        self.f = f
+        self.block_size = block_size
+        self._decoder = json.JSONDecoder()
+
+    def __iter__(self):
+        buf = ""
+        pos = 0
+        eof = False
+        stack = []  # one [is_map, expecting_key] frame per open container
+
+        def after_value():
+            if stack and stack[-1][0]:
+                stack[-1][1] = True
+
+        while True:
+            match = _SKIP.match(buf, pos)
+            pos = match.end()
+            if pos >= len(buf):
+                if eof:
+                    break
+                block = self.f.read(self.block_size)
+                buf = buf[pos:] + block
+                pos = 0
+                eof = not block
+                continue
+
+            c = buf[pos]
+            if c == "{":
+                yield START_MAP, None
+                stack.append([True, True])
+                pos += 1
+            elif c == "[":
+                yield START_ARRAY, None
+                stack.append([False, False])
+                pos += 1
+            elif c == "}" or c == "]":
+                stack.pop()
+                yield (END_MAP if c == "}" else END_ARRAY), None
+                after_value()
+                pos += 1
+            else:
+                # Numbers and literals only end at a delimiter; strings end at their closing quote.
+                if c != '"' and _SCALAR.match(buf, pos).end() >= len(buf) and not eof:
+                    end = len(buf)
+                else:
+                    try:
+                        value, end = self._decoder.raw_decode(buf, pos)
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                        end = len(buf)
+                # A token touching the end of the buffer may continue in the next block.
+                if end >= len(buf) and not eof:
+                    block = self.f.read(self.block_size)
+                    buf = buf[pos:] + block
+                    pos = 0
+                    eof = not block
+                    continue
+                pos = end
+                if stack and stack[-1][0] and stack[-1][1]:
+                    yield KEY, value
+                    stack[-1][1] = False
+                else:
+                    yield VALUE, value
+                    after_value()
+
+
+def materialize(events, event, value):
+    """Builds the Python object that starts with (event, value) from the event stream."""
+    if event == VALUE:
+        return value
+    if event == START_MAP:
+        obj = {}
+        for event, value in events:
+            if event == END_MAP:
+                return obj
+            key = value
+            event, value = next(events)
+            obj[key] = materialize(events, event, value)
+    if event == START_ARRAY:
+        arr = []
+        for event, value in events:
+            if event == END_ARRAY:
+                return arr
+            arr.append(materialize(events, event, value))
+    raise ValueError(f"Unexpected JSON event: {event}")
+
+
+class JsonEventWriter:
+    """Writes JSON events to a text file object, formatted like json.dump(obj, indent=2, ensure_ascii=False)."""
+
+    def __init__(self, f, indent=2):
+        self.f = f
+        self.indent = " " * indent
+        self._stack = []  # [is_map, item_count] per open container
+        self._after_key = False
+
+    def _begin_item(self):
+        if self._after_key:
+            self._after_key = False
+            return
+        if not self._stack:
+            return
+        frame = self._stack[-1]
+        self.f.write(("\n" if frame[1] == 0 else ",\n") + self.indent * len(self._stack))
+        frame[1] += 1
+
+    def start_map(self):
+        self._begin_item()
+        self.f.write("{")
+        self._stack.append([True, 0])
+
+    def start_array(self):
+        self._begin_item()
+        self.f.write("[")
+        self._stack.append([False, 0])
+
+    def _end(self, closing):
+        _, count = self._stack.pop()
+        if count:
+            self.f.write("\n" + self.indent * len(self._stack))
+        self.f.write(closing)
+
+    def end_map(self):
+        self._end("}")
+
+    def end_array(self):
+        self._end("]")
+
+    def key(self, key):
+        self._begin_item()
+        self.f.write(json.dumps(key, ensure_ascii=False) + ": ")
+        self._after_key = True
+
+    def value(self, value):
+        """Writes a scalar or an already materialized object/array."""
+        self._begin_item()
+        text = json.dumps(value, ensure_ascii=False, indent=len(self.indent))
+        self.f.write(text.replace("\n", "\n" + self.indent * len(self._stack)))
+
+    def event(self, event, value):
+        if event == START_MAP:
+            self.start_map()
+        elif event == END_MAP:
+            self.end_map()
+        elif event == START_ARRAY:
+            self.start_array()
+        elif event == END_ARRAY:
+            self.end_array()
+        elif event == KEY:
+            self.key(value)
+        else:
+            self.value(value)
+
+
+# --- Disk-Backed Translation Store ---
+class TranslationStore:
+    """
+    Keeps translations in SQLite instead of a dict, so a multi-GB bundle does
+    not have to fit its translations in memory. Passing a file name keeps the
+    store between runs.
+    """
+
+    def __init__(self, filename=":memory:"):
+        self._db = sqlite3.connect(filename)
+        self._db.execute("CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, text TEXT)")
+        self._pending = 0
+
+    @staticmethod
+    def _encode(key):
+        return json.dumps(key, ensure_ascii=False)
+
+    def put(self, key, text):
+        self._db.execute("INSERT OR REPLACE INTO translations VALUES (?, ?)", (self._encode(key), json.dumps(text, ensure_ascii=False)))
+        self._pending += 1
+        if self._pending >= 500:
+            self.commit()
+
+    def get(self, key, default=None):
+        row = self._db.execute("SELECT text FROM translations WHERE key = ?", (self._encode(key),)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def __contains__(self, key):
+        return self._db.execute("SELECT 1 FROM translations WHERE key = ?", (self._encode(key),)).fetchone() is not None
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def commit(self):
+        self._db.commit()
+        self._pending = 0
+
+    def close(self):
+        self.commit()
+        self._db.close()
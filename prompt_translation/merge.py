@@ -3,9 +3,6 @@ import glob
 import os
 import re
 
-# --- Dosya Yollarını Ayarla ---
-folder_path = "docs_translated"   # CSV dosyalarınızın bulunduğu klasör
-output_file = "merged_jobs.csv"   # Çıkış dosyası ismi
 
 # --- Doğal (Numeric) Sıralama İçin Yardımcı Fonksiyon ---
 def natural_key(string):
@@ -13,15 +10,22 @@ def natural_key(string):
     Dosya isimlerindeki sayıları integer olarak ayıklayarak,
     doğal sıralama yapılmasını sağlar.
     """
-    return [int(text) if text.isdigit() else text.lower() for text in re.split('(\d+)', string)]
+    return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', string)]
 
-# --- Klasördeki Tüm CSV Dosyalarını Bul ve Doğal Sıralama Yap ---
-csv_files = glob.glob(os.path.join(folder_path, "*.csv"))
-csv_files.sort(key=natural_key)
 
-if not csv_files:
-    print("Belirtilen klasörde CSV dosyası bulunamadı.")
-else:
+def merge_csv_files(folder_path="docs_translated", output_file="merged_jobs.csv"):
+    """
+    Klasördeki tüm CSV dosyalarını doğal sıralamayla bulup tek bir CSV dosyasında birleştirir.
+    Sütun isimleri ilk dosyadan alınır. Birleştirilmiş DataFrame'i döndürür.
+    """
+    # --- Klasördeki Tüm CSV Dosyalarını Bul ve Doğal Sıralama Yap ---
+    csv_files = glob.glob(os.path.join(folder_path, "*.csv"))
+    csv_files.sort(key=natural_key)
+
+    if not csv_files:
+        print("Belirtilen klasörde CSV dosyası bulunamadı.")
+        return None
+
     merged_list = []  # Birleştirilecek DataFrame'leri tutmak için liste
 
     # İlk dosyayı normal (header ile) oku
@@ -42,3 +46,4 @@ else:
     # Birleştirilmiş DataFrame'i CSV dosyası olarak kaydet
     merged_df.to_csv(output_file, index=False)
     print(f"Birleştirilmiş CSV başarıyla '{output_file}' dosyasına kaydedildi.")
+    return merged_df
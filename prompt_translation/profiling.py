@@ -0,0 +1,181 @@
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# --- Stage Timing and Tracing ---
+# The pipeline stages (read, dedup, chunk, prompt, request, parse, merge,
+# write) are wrapped in span() calls. They cost almost nothing unless a
+# Tracer is active. An active tracer records every span, passes it to its
+# hooks and can export everything as a Chrome trace (chrome://tracing or
+# https://ui.perfetto.dev). Stages that run in many small pieces, like
+# parsing stream deltas or reading a file lazily, are summed with a
+# StageTimer and recorded as one span.
+
+_DONE = object()
+
+
+class Tracer:
+    """
+    Collects finished spans. Every hook added with add_hook() is called with
+    each span as a dict: name, start and duration (seconds since the tracer
+    was created), thread id and args.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.totals = defaultdict(float)
+        self.counts = defaultdict(int)
+        self._hooks = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def add_hook(self, hook):
+        self._hooks.append(hook)
+
+    def record(self, name, start, duration, args=None):
+        """Records a span that started at perf_counter() time `start`."""
+        span = {
+            "name": name,
+            "start": start - self._origin,
+            "duration": duration,
+            "thread": threading.get_ident(),
+            "args": args or {},
+        }
+        with self._lock:
+            self.spans.append(span)
+            self.totals[name] += duration
+            self.counts[name] += 1
+        for hook in self._hooks:
+            hook(span)
+
+    def export_chrome_trace(self, filename):
+        """Writes the spans in the Chrome trace event format (complete events, times in microseconds)."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span["name"],
+                "cat": "stage",
+                "ph": "X",
+                "ts": round(span["start"] * 1e6, 1),
+                "dur": round(span["duration"] * 1e6, 1),
+                "pid": pid,
+                "tid": span["thread"],
+                "args": span["args"],
+            }
+            for span in self.spans
+        ]
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False, default=str)
+
+    def summary(self):
+        """Returns a table of total time and span count per stage, slowest first."""
+        lines = [f"{'stage':<10} {'total s':>10} {'spans':>8}"]
+        for name, total in sorted(self.totals.items(), key=lambda item: -item[1]):
+            lines.append(f"{name:<10} {total:>10.3f} {self.counts[name]:>8}")
+        return "\n".join(lines)
+
+
+_tracer = None
+
+
+def get_tracer():
+    return _tracer
+
+
+def set_tracer(tracer):
+    """Makes `tracer` (or None) the active tracer for all threads and returns the previous one."""
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+@contextmanager
+def span(name, **args):
+    """Times the enclosed block as one span of stage `name` when a tracer is active."""
+    tracer = _tracer
+    if tracer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        tracer.record(name, start, time.perf_counter() - start, args)
+
+
+class StageTimer:
+    """
+    Sums the time of many short pieces of one stage; use it as a context
+    manager around each piece and call flush() to record the total as a single
+    span ending now.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.total = 0.0
+        self.pieces = 0
+        self._start = None
+
+    def __enter__(self):
+        if _tracer is not None:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self._start is not None:
+            self.total += time.perf_counter() - self._start
+            self.pieces += 1
+            self._start = None
+
+    def flush(self, **args):
+        tracer = _tracer
+        if tracer is not None and self.pieces:
+            tracer.record(self.name, time.perf_counter() - self.total, self.total, dict(args, pieces=self.pieces))
+        self.total = 0.0
+        self.pieces = 0
+
+
+def traced_iter(name, iterable):
+    """Yields from `iterable`, recording the time spent producing the items as one span of stage `name`."""
+    timer = StageTimer(name)
+    iterator = iter(iterable)
+    try:
+        while True:
+            with timer:
+                item = next(iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        timer.flush()
+
+
+@contextmanager
+def capture(trace_file=None, profile_file=None):
+    """
+    Runs the enclosed block with a Tracer active (exported to `trace_file`,
+    with a per-stage summary on stderr) and/or under cProfile (stats of the
+    calling thread dumped to `profile_file`, readable with pstats or snakeviz).
+    """
+    tracer = Tracer() if trace_file else None
+    previous = set_tracer(tracer) if tracer else None
+    profiler = cProfile.Profile() if profile_file else None
+    if profiler:
+        profiler.enable()
+    try:
+        yield tracer
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile_file)
+            print(f"cProfile stats saved to {profile_file}", file=sys.stderr)
+        if tracer:
+            set_tracer(previous)
+            tracer.export_chrome_trace(trace_file)
+            print(tracer.summary(), file=sys.stderr)
+            print(f"Trace saved to {trace_file}", file=sys.stderr)
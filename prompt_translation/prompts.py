@@ -0,0 +1,263 @@
+import json
+
+from .streaming import JsonMemberParser, LineItemParser
+
+# --- Shared Prompts for Every Translation Kind ---
+# Line-format kinds ("skills", "jobs") take plain strings and answer with
+# 'Source: Translation' lines; JSON kinds take (key, text) pairs and answer
+# with a single JSON object.
+
+SKILLS_SYSTEM_PROMPT = "You are a professional translator with expertise in the Turkish labor market, especially in translating technical and skill-related terms."
+JOBS_SYSTEM_PROMPT = "You are a professional translator with expertise in the Turkish labor market and a deep understanding of sector-specific job titles."
+UI_ENGLISH_SYSTEM_PROMPT = "You are a translator specialized in website UI."
+UI_AZERBAIJANI_SYSTEM_PROMPT = "Siz veb UI üçün ixtisaslaşmış tərcüməçisiniz."
+
+
+def create_skills_prompt(skill_list):
+    """
+    Prepares the prompt to be sent to the Groq API.
+    The prompt instructs the model to translate each English skill into Turkish.
+    
+    Instructions:
+      - Provide the translation in the following format:
+            English Skill: Turkish Skill
+      - DO NOT include any additional text or explanations.
+      - If the term represents a programming language, framework, tool, or software product,
+        do not translate it – leave the term unchanged.
+      - If you are not sure about a translation, please leave it blank.
+      
+    For example:
+      cooking: aşçılık
+      painting: resim sanatı
+      programming: programlama
+      data analysis: veri analizi
+      management: yönetim
+      marketing: pazarlama
+      sales: satış
+      python: python
+      java: java
+      WordPress: WordPress
+      
+    Skills:
+    """
+    # List each skill with a number prefix
+    skill_lines = "\n".join([f"{i+1}. {skill}" for i, skill in enumerate(skill_list)])
+    prompt = f"""Below is a list of English skills. Please translate each skill into Turkish using the widely recognized Turkish equivalent.
+    
+For each skill, provide the answer in the following format:
+English Skill: Turkish Skill
+*DO NOT include any additional text or explanations.*
+*DO NOT include any translations that are not commonly used in Turkey.*
+*IF THE TERM IS A PROGRAMMING LANGUAGE, FRAMEWORK, TOOL, OR SOFTWARE PRODUCT, DO NOT TRANSLATE IT (LEAVE IT UNCHANGED).*
+*IF YOU ARE NOT SURE ABOUT A TRANSLATION, PLEASE LEAVE IT BLANK.*
+
+For example:
+Cooking: Aşçılık
+painting: resim sanatı
+programming: programlama
+data analysis: veri analizi
+Management: Yönetim
+marketing: pazarlama
+sales: satış
+python: python
+java: java
+WordPress: WordPress
+
+Skills:
+{skill_lines}
+"""
+    return prompt
+
+
+def create_job_titles_prompt(job_list):
+    """
+    Prepares the prompt to be sent to the Groq API.
+    The prompt instructs to translate the given job titles into Turkish,
+    using the Turkish job titles that are commonly used in Turkey.
+    """
+    job_lines = "\n".join([f"{i+1}. {job}" for i, job in enumerate(job_list)])
+    prompt = f"""Below is a list of English job titles. Please translate each title into Turkish using the job titles that are widely recognized and appropriately sector-specific in Turkey.
+
+For each job title, provide the answer in the following format:
+English Job Title: Turkish Job Title
+*DO NOT include any additional text or explanations!!!.*
+*DO NOT include any additional text or explanations!!!.*
+*DO NOT include any additional text or explanations!!!.*
+*DO NOT include any translations that are not commonly used in Turkey.*
+*IF YOU ARE NOT SURE ABOUT A TRANSLATION, PLEASE LEAVE IT BLANK.*
+For example:
+Software Engineer: Yazılım Mühendisi
+
+If there is no direct translation, provide the closest equivalent.
+    
+Job Titles:
+{job_lines}
+"""
+    return prompt
+
+
+def create_ui_english_prompt(chunk):
+    """
+    Asks the model to translate a list of Turkish UI strings into English.
+    The model should return a JSON object mapping each path to its English translation.
+    """
+    lines = "\n".join(
+        f"{i+1}. \"{path}\": \"{text}\"" for i, (path, text) in enumerate(chunk)
+    )
+    return f"""
+You are a professional translator translating Turkish UI labels, buttons, and messages into natural, context‑aware English for a web application.
+
+Please output a single valid JSON object mapping each key path to its English translation. Example output:
+
+{{
+  "homePage.welcome": "Welcome to the Academy!",
+  "sidebar.homePage": "Home"
+}}
+
+Do not include any additional keys or commentary.
+
+Here are the Turkish strings to translate:
+{lines}
+"""
+
+
+def create_ui_azerbaijani_prompt(chunk):
+    """
+    Asks the model to translate Turkish UI strings into natural, context‑aware Azerbaijani.
+    The model should return a single valid JSON object mapping each path to its Azerbaijani translation.
+    """
+    lines = "\n".join(
+        f"{i+1}. \"{path}\": \"{text}\"" for i, (path, text) in enumerate(chunk)
+    )
+    return f"""
+Siz veb tətbiqin UI etiketi, düymə yazısı və mesajlarını **məzmun kontekstində** təbii Azərbaycan dilinə tərcümə edən peşəkar tərcüməçisiniz.
+
+Xahiş olunur, yalnız **tək bir düzgün JSON** obyektini qaytarın, açar – yol (məs. "homePage.welcome"), dəyər – Azərbaycan dilində tərcümə. Məsələn:
+
+{{
+  "homePage.welcome": "Akademiyaya xoş gəlmisiniz!",
+  "sidebar.homePage": "Ana səhifə"
+}}
+
+Əlavə açarlar və ya şərhlər daxil etməyin.
+
+Aşağıdakı Türkçe UI yazılarını tərcümə edin:
+{lines}
+"""
+
+
+def create_backend_english_prompt(chunk):
+    """
+    Asks the model to translate Turkish backend resource strings into English.
+    The model should return a JSON object mapping each _name to its English translation.
+    """
+    lines = "\n".join(
+        f"{i+1}. \"{key}\": \"{text}\"" for i, (key, text) in enumerate(chunk)
+    )
+    return f"""
+You are a professional translator translating Turkish UI labels, buttons, and messages into natural, context-aware English for a web application called "Academy" that provides educational content. The translations should read naturally for a modern, user-friendly interface.
+
+Please output a single valid JSON object mapping each key (_name) to its English translation. Example output:
+{{
+  "AbsentDuration": "Time Absent From Course",
+  "AccessDate": "Date of Access"
+}}
+
+Do not include any additional keys, commentary, or markdown (e.g., ```json). Output only the JSON object with proper formatting.
+
+*Do not use the word "Training" in translations; use "Course" instead.*
+
+Here are the Turkish strings to translate (each key: value pair):
+{lines}
+"""
+
+
+def create_job_descriptions_prompt(chunk):
+    """
+    Asks the model to translate English job description sentences into Turkish.
+    Sentences are JSON-quoted since they may contain quotes and colons; the
+    model should return a JSON object mapping each id to its Turkish translation.
+    """
+    lines = "\n".join(
+        f"{i+1}. \"{key}\": {json.dumps(text, ensure_ascii=False)}" for i, (key, text) in enumerate(chunk)
+    )
+    return f"""
+You are a professional translator translating English job postings into natural, professional Turkish as used in Turkish job listings.
+
+Each line below is one sentence (or part of a sentence) of a job description. Translate each one on its own, keeping its meaning, tone and any list markers, numbers or product names. Keep programming languages, frameworks, tools and software products unchanged.
+
+Please output a single valid JSON object mapping each id to its Turkish translation. Example output:
+{{
+  "s1": "Çevik bir ekipte çalışacak deneyimli bir yazılım mühendisi arıyoruz.",
+  "s2": "Rekabetçi maaş ve esnek çalışma saatleri sunuyoruz."
+}}
+
+Do not include any additional keys or commentary.
+
+Here are the English sentences to translate:
+{lines}
+"""
+
+
+def create_table_rows_prompt(chunk):
+    """
+    Asks the model to translate several English fields of each table row into Turkish at once,
+    so related fields (title, category, description) stay consistent.
+    The model should return a JSON object mapping each row id to an object with the same field names.
+    """
+    lines = "\n".join(
+        f"{i+1}. \"{key}\": {json.dumps(fields, ensure_ascii=False)}" for i, (key, fields) in enumerate(chunk)
+    )
+    return f"""
+You are a professional translator translating English job and skill catalog entries into Turkish as used in the Turkish labor market.
+
+Each line below is one row of a table: a row id and a JSON object of its fields. Translate every field value into Turkish, keeping the fields of the same row consistent with each other (e.g. a title and its category should use the same terms). Keep programming languages, frameworks, tools and software products unchanged. If you are not sure about a translation, leave that field as an empty string.
+
+Please output a single valid JSON object mapping each row id to an object with exactly the same field names and the Turkish values. Example output:
+{{
+  "r1": {{"Title": "Yazılım Mühendisi", "Category": "Bilgi Teknolojileri"}},
+  "r2": {{"Title": "Muhasebeci", "Category": "Finans"}}
+}}
+
+Do not include any additional keys or commentary.
+
+Here are the rows to translate:
+{lines}
+"""
+
+
+class PromptSpec:
+    """How to ask for, and parse the answer to, one kind of translation."""
+
+    def __init__(self, create_prompt, system_prompt, parser=LineItemParser, item_key=None, temperature=0.3):
+        self.create_prompt = create_prompt
+        self.system_prompt = system_prompt
+        self.parser = parser
+        # Maps a chunk item to the key the model is expected to answer with
+        self.item_key = item_key or (lambda item: item)
+        self.temperature = temperature
+
+    def messages(self, chunk):
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": self.create_prompt(chunk)}
+        ]
+
+
+def _pair_key(entry):
+    return entry[0]
+
+
+PROMPTS = {
+    "skills": PromptSpec(create_skills_prompt, SKILLS_SYSTEM_PROMPT),
+    "jobs": PromptSpec(create_job_titles_prompt, JOBS_SYSTEM_PROMPT),
+    "ui-en": PromptSpec(create_ui_english_prompt, UI_ENGLISH_SYSTEM_PROMPT, JsonMemberParser, _pair_key),
+    "ui-az": PromptSpec(create_ui_azerbaijani_prompt, UI_AZERBAIJANI_SYSTEM_PROMPT, JsonMemberParser, _pair_key),
+    "backend-en": PromptSpec(create_backend_english_prompt, UI_ENGLISH_SYSTEM_PROMPT, JsonMemberParser, _pair_key),
+    "descriptions": PromptSpec(create_job_descriptions_prompt, JOBS_SYSTEM_PROMPT, JsonMemberParser, _pair_key),
+    "rows-skills": PromptSpec(create_table_rows_prompt, SKILLS_SYSTEM_PROMPT, JsonMemberParser, _pair_key),
+    "rows-jobs": PromptSpec(create_table_rows_prompt, JOBS_SYSTEM_PROMPT, JsonMemberParser, _pair_key),
+}
+
+# Kinds whose items are plain strings
+LINE_KINDS = ("skills", "jobs")
@@ -0,0 +1,156 @@
+import os
+import re
+
+import pandas as pd
+
+# --- QA Thresholds ---
+MIN_LENGTH_RATIO = 0.4   # translation length / source length
+MAX_LENGTH_RATIO = 2.5
+LENGTH_SLACK = 6         # short strings may differ by this many characters regardless of ratio
+
+# Letters that may appear in a translation for each target language (besides digits, punctuation and spaces).
+ALLOWED_LETTERS = {
+    "tr": "a-zA-ZçğıöşüÇĞİÖŞÜâîûÂÎÛ",
+    "az": "a-zA-ZçğıöşüəÇĞİÖŞÜƏ",
+}
+
+# Terms that are expected to stay unchanged (programming languages, tools, brands, ...)
+DEFAULT_GLOSSARY = {
+    "python", "java", "javascript", "wordpress", "excel", "linux", "docker", "kubernetes",
+    "react", "angular", "django", "photoshop", "autocad", "sap", "sql", "html", "css", "git",
+    # Vendors; product lines ("Microsoft Office", "Drupal") belong in the --glossary file
+    "microsoft", "oracle", "adobe", "ibm", "cisco", "apache", "google", "amazon", "aws", "azure",
+    "salesforce", "autodesk", "apple", "android", "windows", "vmware", "citrix", "sybase", "yardi",
+}
+
+
+def load_glossary(path=None):
+    """Returns the casefolded set of terms that may be copied unchanged, plus those in the file at `path`."""
+    glossary = set(DEFAULT_GLOSSARY)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            glossary.update(line.strip().casefold() for line in f if line.strip())
+    return glossary
+
+
+# --- Step 1: Vectorized Checks ---
+# A word that is an acronym or symbol token (SQL, C++, .NET, 3D, &) ...
+ACRONYM_WORD = r"[A-Z0-9.+#/&\-]+"
+# ... or a technical name: CamelCase (SharePoint, NiFi, iOS) or with digits or +/# (Web2.0, F#)
+TECHNICAL_WORD = r"[\w.+#/&\-]*(?:[a-z][A-Z]|[\d+#])[\w.+#/&\-]*"
+
+
+def looks_like_term(source, glossary, strict=False):
+    """
+    True for sources made up only of names the prompts ask the model to keep
+    unchanged: glossary terms ("Microsoft Excel"), acronyms (SQL, C++) and
+    technical names (SharePoint, 3D). "GPS Applications" or "Doctor" are not:
+    every word must be a name. With `strict` only glossary terms and acronyms
+    count.
+    """
+    terms = sorted(glossary, key=len, reverse=True)
+    glossary_term = rf"(?<!\w)(?:{'|'.join(re.escape(term) for term in terms)})(?!\w)" if terms else r"(?!)"
+    words = (
+        source.reset_index(drop=True).str.replace(glossary_term, " ", regex=True, flags=re.IGNORECASE)
+        .str.split().explode().dropna()
+    )
+    name_word = words.str.fullmatch(ACRONYM_WORD)
+    if not strict:
+        name_word |= words.str.fullmatch(TECHNICAL_WORD)
+    # Sources with no word left were glossary terms only.
+    is_term = name_word.groupby(level=0).all().reindex(range(len(source)), fill_value=True)
+    return pd.Series(is_term.to_numpy(), index=source.index)
+
+
+def run_checks(df, source_column, target_column, language="tr", glossary=None):
+    """
+    Runs every QA check over whole columns at once and returns a boolean
+    DataFrame with one column per check (True = suspicious).
+    """
+    glossary = glossary if glossary is not None else load_glossary()
+    source = df[source_column].fillna("").astype(str).str.strip()
+    target = df[target_column].fillna("").astype(str).str.strip()
+    source_len = source.str.len()
+    target_len = target.str.len()
+
+    checks = pd.DataFrame(index=df.index)
+    checks["blank"] = target_len.eq(0) & source_len.gt(0)
+
+    # Runaway or truncated output: ratio outside the band and not just a small absolute difference.
+    ratio = target_len / source_len.where(source_len > 0)
+    outside_band = ratio.lt(MIN_LENGTH_RATIO) | ratio.gt(MAX_LENGTH_RATIO)
+    checks["length_ratio"] = outside_band & (target_len - source_len).abs().gt(LENGTH_SLACK) & ~checks["blank"]
+
+    # Any letter outside the target alphabet (Cyrillic, CJK, stray diacritics, ...)
+    foreign_letter = rf"(?![{ALLOWED_LETTERS[language]}])[^\W\d_]"
+    checks["wrong_script"] = target.str.contains(foreign_letter, regex=True)
+
+    # Source copied verbatim, unless it looks like a name the prompt says to keep unchanged.
+    copied = target.str.casefold().eq(source.str.casefold()) & source_len.gt(0)
+    checks["copied_source"] = copied & ~looks_like_term(source, glossary)
+
+    # Echoed list numbering from the prompt, e.g. "12. Yazılım Mühendisi"
+    # (sources that start with a number, like "21st Century Skills", keep their ordinal)
+    checks["numbering"] = target.str.match(r"^\d+\s*[.)]\s") & ~source.str.match(r"^\d")
+    return checks
+
+
+def summarize_flags(checks):
+    """Joins the names of the failed checks per row into a ';'-separated string."""
+    return checks.dot(checks.columns + ";").str.rstrip(";")
+
+
+# --- Step 2: Flag Rows and Build the Re-translation Queue ---
+def qa_file(filename, source_column, target_column, language="tr", glossary_file=None):
+    """
+    Loads a translation result table, adds a 'qa_flags' column and writes:
+      - <name>_qa.csv: every row with its flags
+      - <name>_retranslate.csv: only flagged rows, with the source column,
+        ready to be used as the input file of the translation scripts
+    Returns the DataFrame of flagged rows.
+    """
+    df = pd.read_csv(filename)
+    checks = run_checks(df, source_column, target_column, language, load_glossary(glossary_file))
+    df["qa_flags"] = summarize_flags(checks)
+    flagged = df[checks.any(axis=1)]
+
+    base = os.path.splitext(filename)[0]
+    df.to_csv(f"{base}_qa.csv", index=False)
+    flagged[[source_column]].drop_duplicates().to_csv(f"{base}_retranslate.csv", index=False)
+
+    print(f"For {filename}:")
+    print(f"Rows checked: {len(df)}")
+    for name, count in checks.sum().items():
+        print(f"  {name}: {count}")
+    print(f"Rows queued for re-translation: {len(flagged)} -> {base}_retranslate.csv")
+    return flagged
+
+
+# --- Step 3: Patch the Re-translations Back ---
+def apply_retranslations(filename, retranslated_file, source_column, target_column):
+    """
+    Writes the translations of a re-translation run (the output of the csv
+    command on <name>_retranslate.csv) back into the result table `filename`,
+    matching rows by source text. Blank re-translations leave the old value.
+    Returns the number of updated rows.
+    """
+    df = pd.read_csv(filename)
+    retranslated = pd.read_csv(retranslated_file)
+    for name, table in [(filename, df), (retranslated_file, retranslated)]:
+        for column in (source_column, target_column):
+            if column not in table.columns:
+                raise ValueError(f"Column '{column}' not found in {name}!")
+
+    new_values = (
+        retranslated.dropna(subset=[target_column])
+        .loc[lambda t: t[target_column].astype(str).str.strip().ne("")]
+        .drop_duplicates(subset=[source_column], keep="last")
+        .set_index(source_column)[target_column]
+    )
+    replacement = df[source_column].map(new_values)
+    changed = replacement.notna() & replacement.ne(df[target_column])
+    df[target_column] = replacement.where(replacement.notna(), df[target_column])
+    df.to_csv(filename, index=False)
+    print(f"Updated {int(changed.sum())} rows of {filename} from {retranslated_file}")
+    return int(changed.sum())
+
@@ -0,0 +1,254 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from .profiling import span
+from .prompts import PROMPTS
+from .streaming import ChunkQueue, stream_translations
+from .transport import DEFAULT_MODELS, get_client
+
+# --- Fair Multi-Job Scheduler ---
+# Several translation jobs (tables, locale JSON, backend JSON) share one
+# provider quota. Every job runs in its own thread and asks the scheduler for
+# a turn before each request; turns are granted by start-time fair queuing
+# weighted by the job's priority, and only when the shared requests-per-minute
+# and tokens-per-minute buckets can cover the request. An urgent job gets the
+# next free turn and most of the quota, while bulk jobs keep a smaller but
+# guaranteed share, so they are never starved.
+
+# Share of the quota per unit of job weight for each priority
+PRIORITY_WEIGHTS = {
+    "urgent": 8.0,
+    "normal": 2.0,
+    "bulk": 1.0,
+}
+
+
+def estimate_tokens(messages, chunk):
+    """Rough token cost of a request: ~4 characters per token for the prompt, plus the source and translation of every item."""
+    prompt_chars = sum(len(message["content"]) for message in messages)
+    item_chars = sum(len(str(item)) for item in chunk)
+    return (prompt_chars + 2 * item_chars) // 4 + 1
+
+
+class ProviderQuota:
+    """
+    Token buckets for the provider's requests-per-minute and (optionally)
+    tokens-per-minute limits. Requests are spread evenly over the minute;
+    tokens may be spent up to one minute's worth at once.
+    """
+
+    def __init__(self, requests_per_minute=30, tokens_per_minute=None):
+        self.request_rate = requests_per_minute / 60.0
+        self.token_rate = tokens_per_minute / 60.0 if tokens_per_minute else None
+        self.token_capacity = tokens_per_minute
+        self._requests = 1.0
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(1.0, self._requests + elapsed * self.request_rate)
+        if self.token_rate:
+            self._tokens = min(self.token_capacity, self._tokens + elapsed * self.token_rate)
+        return now
+
+    def wait_time(self, tokens):
+        """Seconds until a request costing `tokens` fits in the quota (0 if it fits now)."""
+        now = self._refill()
+        wait = max(self._paused_until - now, (1.0 - self._requests) / self.request_rate, 0.0)
+        if self.token_rate:
+            # A request larger than the bucket waits for a full bucket instead of forever.
+            tokens = min(tokens, self.token_capacity)
+            wait = max(wait, (tokens - self._tokens) / self.token_rate)
+        return wait
+
+    def take(self, tokens):
+        self._refill()
+        self._requests -= 1.0
+        if self.token_rate:
+            self._tokens -= min(tokens, self.token_capacity)
+
+    def pause(self, seconds):
+        """Holds every job back for `seconds`, e.g. after the provider rejected a request."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class ScheduledJob:
+    """One job of a FairScheduler; pass it as `scheduler=` to translate_chunks or the translate_* functions."""
+
+    def __init__(self, scheduler, name, priority="normal", weight=1.0):
+        if priority not in PRIORITY_WEIGHTS:
+            raise ValueError(f"Unknown priority: {priority} (expected one of {', '.join(PRIORITY_WEIGHTS)})")
+        self.scheduler = scheduler
+        self.name = name
+        self.priority = priority
+        self.share = weight * PRIORITY_WEIGHTS[priority]
+        self.start_tag = 0.0
+        self.finish_tag = 0.0
+        self.requests = 0
+
+    def run(self, chunks, kind, on_item, client, model, max_attempts=3, on_chunk_done=None):
+        """Like translate_chunks, but every request waits for this job's turn instead of a fixed interval."""
+        spec = PROMPTS[kind]
+        queue = ChunkQueue(chunks, key=spec.item_key, max_attempts=max_attempts)
+
+        for idx, chunk in enumerate(queue, start=1):
+            with span("prompt", job=self.name, chunk=idx):
+                messages = spec.messages(chunk)
+            with self.scheduler.turn(self, estimate_tokens(messages, chunk)), \
+                    span("request", job=self.name, chunk=idx, items=len(chunk)):
+                print(f"[{self.name}] Translating chunk {idx}/{queue.total}…" if queue.total
+                      else f"[{self.name}] Translating chunk {idx}…")
+                _, finish_reason = stream_translations(
+                    client,
+                    spec.parser(),
+                    expected_keys=queue.keys(chunk),
+                    on_item=on_item,
+                    on_missing=queue.report_missing,
+                    model=model,
+                    messages=messages,
+                    temperature=spec.temperature
+                )
+            if finish_reason == "error":
+                # Most likely a 429: back off for every job, not just this one.
+                self.scheduler.quota.pause(self.scheduler.error_backoff)
+            if on_chunk_done:
+                on_chunk_done(idx)
+
+
+class FairScheduler:
+    """
+    Grants request turns to the jobs sharing `quota`, at most `max_in_flight`
+    at a time. Waiting jobs are served in order of their start tag (start-time
+    fair queuing), so over time each job gets a share of the tokens
+    proportional to its weight times its priority weight.
+    """
+
+    def __init__(self, quota, max_in_flight=4, error_backoff=20.0):
+        self.quota = quota
+        self.max_in_flight = max_in_flight
+        self.error_backoff = error_backoff
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._in_flight = 0
+        self._virtual_time = 0.0
+        self._arrivals = 0
+
+    def job(self, name, priority="normal", weight=1.0):
+        return ScheduledJob(self, name, priority=priority, weight=weight)
+
+    def _next_job(self):
+        return min(self._waiting, key=lambda entry: (entry[0].start_tag, -entry[0].share, entry[1]))[0]
+
+    @contextmanager
+    def turn(self, job, tokens):
+        """Blocks until `job` may send a request costing about `tokens`, then holds the slot until the block ends."""
+        with self._cond:
+            # A job coming back from idle does not get credit for the time it was away.
+            job.start_tag = max(self._virtual_time, job.finish_tag)
+            self._arrivals += 1
+            entry = (job, self._arrivals)
+            self._waiting.append(entry)
+            self._cond.notify_all()
+            while True:
+                if self._in_flight < self.max_in_flight and self._next_job() is job:
+                    wait = self.quota.wait_time(tokens)
+                    if wait <= 0:
+                        break
+                    # Re-check after the wait: a more urgent job may have arrived meanwhile.
+                    self._cond.wait(wait)
+                else:
+                    self._cond.wait()
+            self._waiting.remove(entry)
+            self.quota.take(tokens)
+            self._in_flight += 1
+            self._virtual_time = job.start_tag
+            job.finish_tag = job.start_tag + tokens / job.share
+            job.requests += 1
+            self._cond.notify_all()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+
+# --- Running a Job File ---
+def _job_runners():
+    from .json_resources import translate_backend_json, translate_nested_json
+    from .tabular import translate_table
+
+    return {
+        "csv": translate_table,
+        "xlsx": translate_table,
+        "json": translate_nested_json,
+        "backend-json": translate_backend_json,
+    }
+
+
+def run_jobs(jobs_file, provider=None, model=None):
+    """
+    Runs every job of a JSON job file concurrently under one FairScheduler.
+
+        {"provider": "groq", "requests_per_minute": 30, "tokens_per_minute": 60000, "max_in_flight": 4,
+         "jobs": [{"command": "csv", "input": "skills.csv", "output": "translated_skills.csv",
+                   "kind": "skills", "priority": "bulk"},
+                  {"command": "json", "input": "translation.json", "output": "translation_az.json",
+                   "language": "az", "priority": "urgent"}]}
+
+    Other job fields are passed to the command's translate function (e.g.
+    "chunk_size", "store_file", "checkpoint"). Returns the names of failed jobs.
+    """
+    with open(jobs_file, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    provider = provider or config.get("provider", "groq")
+    model = model or config.get("model") or DEFAULT_MODELS[provider]
+    get_client(provider)  # create the shared client once, before the job threads start
+    scheduler = FairScheduler(
+        ProviderQuota(config.get("requests_per_minute", 30), config.get("tokens_per_minute")),
+        max_in_flight=config.get("max_in_flight", 4),
+    )
+
+    runners = _job_runners()
+    threads = []
+    failed = []
+    for number, job_config in enumerate(config.get("jobs", []), start=1):
+        if not isinstance(job_config, dict):
+            raise ValueError(f"Job {number}: expected an object, got {type(job_config).__name__}")
+        options = dict(job_config)
+        command = options.pop("command", None)
+        if command not in runners:
+            raise ValueError(f"Job {number}: unknown command {command!r} (expected one of {', '.join(runners)})")
+        missing = [field for field in ("input", "output") if field not in options]
+        if missing:
+            raise ValueError(f"Job {number}: missing {'/'.join(repr(field) for field in missing)}")
+        if "hedge_options" in options:
+            raise ValueError(f"Job {number}: hedge_options is not supported for scheduled jobs")
+        name = options.pop("name", f"{command}-{number}")
+        job = scheduler.job(name, priority=options.pop("priority", "normal"), weight=options.pop("weight", 1.0))
+        args = (options.pop("input"), options.pop("output"))
+        options.setdefault("model", model)
+
+        def run(runner=runners[command], job=job, args=args, options=options):
+            try:
+                runner(*args, provider=provider, scheduler=job, **options)
+            except Exception as e:
+                print(f"[{job.name}] failed: {e}")
+                failed.append(job.name)
+
+        threads.append(threading.Thread(target=run, name=name))
+
+    start_time = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"All {len(threads)} jobs finished in {time.time() - start_time:.2f} seconds.")
+    return failed
@@ -0,0 +1,131 @@
+import re
+
+# --- Sentence Segmentation for Long Free-Text Cells ---
+# Job descriptions are split into sentences before translation, so one long
+# cell can no longer fill a chunk or run past the output limit, and
+# boilerplate sentences repeated across rows ("We offer a competitive
+# salary.") are translated once. Cells are reassembled from their translated
+# sentences in the original order, with the original whitespace between them.
+
+SEGMENT_THRESHOLD = 200   # cells longer than this many characters are split into sentences
+MAX_SEGMENT_CHARS = 400   # longer sentences are wrapped at word boundaries
+MAX_CHUNK_CHARS = 6000    # source characters per request
+
+# Whitespace after a sentence end followed by something that starts a sentence, or a line break
+_BOUNDARY = re.compile(r"((?<=[.!?…])\s+(?=[\"'“(\[]?[A-Z0-9ÇĞİÖŞÜ])|\s*\n\s*)")
+_ABBREVIATION = re.compile(r"(?:\b(?:e\.g|i\.e|etc|vs|Mr|Mrs|Ms|Dr|Prof|Inc|Ltd|Co|No|approx)\.|\b[A-Z]\.)$")
+
+
+def _wrap(sentence, limit):
+    """
+    Splits a sentence longer than `limit` at spaces; returns the pieces and
+    the separators between them (the spaces cut out, or "" where a token
+    without spaces had to be cut).
+    """
+    pieces, separators = [], []
+    while len(sentence) > limit:
+        cut = sentence.rfind(" ", 0, limit + 1)
+        piece = sentence[:cut].rstrip(" ") if cut > 0 else sentence[:limit]
+        rest = sentence[len(piece):]
+        sentence = rest.lstrip(" ")
+        pieces.append(piece)
+        separators.append(rest[:len(rest) - len(sentence)])
+    pieces.append(sentence)
+    return pieces, separators
+
+
+def split_segments(text, threshold=SEGMENT_THRESHOLD, max_chars=MAX_SEGMENT_CHARS):
+    """
+    Splits `text` into segments and the separators around them:
+    text == separators[0] + segments[0] + separators[1] + ... + segments[-1] + separators[-1].
+    Texts up to `threshold` characters stay a single segment.
+    """
+    core = text.strip()
+    lead = text[:len(text) - len(text.lstrip())]
+    trail = text[len(text.rstrip()):]
+    if not core:
+        return [], [text]
+    if len(core) <= threshold:
+        return [core], [lead, trail]
+
+    parts = _BOUNDARY.split(core)
+    sentences, gaps = [parts[0]], []
+    for gap, sentence in zip(parts[1::2], parts[2::2]):
+        # "e.g. Python" or "Dr. Smith" does not end a sentence.
+        if "\n" not in gap and _ABBREVIATION.search(sentences[-1]):
+            sentences[-1] += gap + sentence
+        else:
+            gaps.append(gap)
+            sentences.append(sentence)
+
+    segments, separators = [], [lead]
+    for i, sentence in enumerate(sentences):
+        pieces, spaces = _wrap(sentence, max_chars)
+        segments.extend(pieces)
+        separators.extend(spaces)
+        separators.append(gaps[i] if i < len(gaps) else trail)
+    return segments, separators
+
+
+class SegmentedCells:
+    """
+    Splits a list of cells into sentence segments, deduplicated across all
+    cells. Each distinct segment gets an id ("s1", "s2", ...); the model
+    translates (id, segment) pairs and reassemble() rebuilds every cell.
+    """
+
+    def __init__(self, cells, threshold=SEGMENT_THRESHOLD):
+        self._ids = {}     # segment text -> id
+        self._plans = []   # per cell: (segment ids, separators), or None for non-text cells
+        for cell in cells:
+            if not isinstance(cell, str):
+                self._plans.append(None)
+                continue
+            segments, separators = split_segments(cell, threshold)
+            ids = [self._ids.setdefault(segment, f"s{len(self._ids) + 1}") for segment in segments]
+            self._plans.append((ids, separators))
+        self._texts = {segment_id: text for text, segment_id in self._ids.items()}
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, segment_id):
+        return segment_id in self._texts
+
+    def text(self, segment_id):
+        return self._texts[segment_id]
+
+    def pairs(self):
+        """Returns the distinct (id, segment) pairs in first-seen order."""
+        return [(segment_id, text) for text, segment_id in self._ids.items()]
+
+    def reassemble(self, translations):
+        """
+        Rebuilds every cell from the translations of its segments (a dict of
+        id -> text). Cells with an untranslated segment come back as None.
+        """
+        cells = []
+        for plan in self._plans:
+            if plan is None or any(segment_id not in translations for segment_id in plan[0]):
+                cells.append(None)
+                continue
+            ids, separators = plan
+            parts = [separators[0]]
+            for segment_id, separator in zip(ids, separators[1:]):
+                parts.append(translations[segment_id])
+                parts.append(separator)
+            cells.append("".join(parts))
+        return cells
+
+
+def pack_segments(pairs, max_items, max_chars=MAX_CHUNK_CHARS):
+    """Groups (id, segment) pairs into chunks of at most `max_items` pairs and about `max_chars` characters."""
+    chunk, size = [], 0
+    for pair in pairs:
+        if chunk and (len(chunk) >= max_items or size + len(pair[1]) > max_chars):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(pair)
+        size += len(pair[1])
+    if chunk:
+        yield chunk
@@ -0,0 +1,268 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .prompts import LINE_KINDS, PROMPTS
+from .streaming import stream_translations
+from .transport import DEFAULT_MODELS
+
+# --- Local Translation Service ---
+# Accepts single strings or small batches over HTTP, coalesces concurrent
+# callers into model-sized batches and answers cache hits immediately.
+#
+#   POST /translate  {"kind": "skills", "texts": ["cooking", "python"]}
+#                    {"kind": "jobs", "text": "Software Engineer"}
+#   GET  /health
+
+
+class TranslationCache:
+    """Thread-safe LRU cache of (kind, text) -> translation."""
+
+    def __init__(self, max_size=100_000):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class MicroBatcher:
+    """
+    Collects texts submitted by concurrent callers and sends them to the model
+    in batches of up to `batch_size`, waiting at most `window` seconds after the
+    first queued text. Identical texts waiting or in flight share one Future.
+    """
+
+    def __init__(self, client, kind, cache, batch_size=50, window=0.05,
+                 max_in_flight=4, requests_per_minute=30, model=DEFAULT_MODELS["groq"]):
+        self.client = client
+        self.kind = kind
+        self.cache = cache
+        self.batch_size = batch_size
+        self.window = window
+        self.model = model
+        self.min_interval = 60.0 / requests_per_minute
+        self.spec = PROMPTS[kind]
+
+        self._pending = OrderedDict()  # text -> Future, waiting for a batch
+        self._in_flight = {}           # text -> Future, request already sent
+        self._first_arrival = None
+        self._lock = threading.Condition()
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._last_request = 0.0
+        threading.Thread(target=self._dispatch_loop, daemon=True).start()
+
+    def submit(self, texts):
+        """Returns one Future per text; cache hits are already resolved."""
+        futures = []
+        with self._lock:
+            for text in texts:
+                cached = self.cache.get((self.kind, text))
+                if cached is not None:
+                    future = Future()
+                    future.set_result(cached)
+                elif text in self._pending:
+                    future = self._pending[text]
+                elif text in self._in_flight:
+                    future = self._in_flight[text]
+                else:
+                    future = Future()
+                    self._pending[text] = future
+                    if self._first_arrival is None:
+                        self._first_arrival = time.monotonic()
+                    self._lock.notify()
+                futures.append(future)
+        return futures
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending) + len(self._in_flight)
+
+    def _next_batch(self):
+        """Blocks until a batch is full or the window since its first text has passed."""
+        with self._lock:
+            while True:
+                if self._pending:
+                    waited = time.monotonic() - self._first_arrival
+                    if len(self._pending) >= self.batch_size or waited >= self.window:
+                        break
+                    self._lock.wait(self.window - waited)
+                else:
+                    self._lock.wait()
+            batch = {}
+            while self._pending and len(batch) < self.batch_size:
+                text, future = self._pending.popitem(last=False)
+                batch[text] = future
+            self._in_flight.update(batch)
+            self._first_arrival = time.monotonic() if self._pending else None
+            return batch
+
+    def _dispatch_loop(self):
+        while True:
+            # Wait for a free request slot first, so texts keep accumulating
+            # into larger batches while all slots are busy.
+            self._slots.acquire()
+            batch = self._next_batch()
+            # Respect the provider rate limit between request starts.
+            sleep_duration = self._last_request + self.min_interval - time.monotonic()
+            if sleep_duration > 0:
+                time.sleep(sleep_duration)
+            self._last_request = time.monotonic()
+            self._executor.submit(self._translate_batch, batch)
+
+    def _translate_batch(self, batch):
+        texts = list(batch)
+
+        def resolve(text, translation):
+            future = batch.get(text)
+            if future is None or future.done():
+                return
+            # A blank answer means the model was unsure; resolve to None and let the next caller retry.
+            if not isinstance(translation, str) or not translation.strip():
+                return
+            self.cache.put((self.kind, text), translation)
+            future.set_result(translation)
+
+        try:
+            stream_translations(
+                self.client,
+                self.spec.parser(),
+                on_item=resolve,
+                model=self.model,
+                messages=self.spec.messages(texts),
+                temperature=self.spec.temperature
+            )
+        finally:
+            # Texts the model skipped or left blank resolve to None (not cached).
+            with self._lock:
+                for text, future in batch.items():
+                    if not future.done():
+                        future.set_result(None)
+                    self._in_flight.pop(text, None)
+            self._slots.release()
+
+
+# --- HTTP Interface ---
+class TranslationHandler(BaseHTTPRequestHandler):
+    server_version = "TranslationServer/1.0"
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._send_json(404, {"error": "Not found"})
+            return
+        self._send_json(200, {
+            "status": "ok",
+            "cache_size": len(self.server.cache),
+            "pending": {kind: b.pending_count() for kind, b in self.server.batchers.items()},
+        })
+
+    def do_POST(self):
+        if self.path != "/translate":
+            self._send_json(404, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_json(400, {"error": f"Invalid JSON body: {e}"})
+            return
+        if not isinstance(request, dict):
+            self._send_json(400, {"error": "Request body must be a JSON object"})
+            return
+
+        kind = request.get("kind", "skills")
+        if kind not in self.server.batchers:
+            self._send_json(400, {"error": f"Unknown kind '{kind}', expected one of {sorted(self.server.batchers)}"})
+            return
+        single = "text" in request
+        texts = [request["text"]] if single else request.get("texts")
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            self._send_json(400, {"error": "Provide 'text' (string) or 'texts' (list of strings)"})
+            return
+        if not all(t.strip() and "\n" not in t and "\r" not in t for t in texts):
+            self._send_json(400, {"error": "Texts must be non-blank single lines"})
+            return
+        if len(texts) > self.server.max_request_items:
+            self._send_json(413, {"error": f"At most {self.server.max_request_items} texts per request"})
+            return
+
+        futures = self.server.batchers[kind].submit([t.strip() for t in texts])
+        deadline = time.monotonic() + self.server.request_timeout
+        try:
+            results = [f.result(timeout=max(deadline - time.monotonic(), 0)) for f in futures]
+        except FutureTimeoutError:
+            self._send_json(504, {"error": "Timed out waiting for translation"})
+            return
+        if single:
+            self._send_json(200, {"translation": results[0]})
+        else:
+            self._send_json(200, {"translations": results})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def build_server(host, port, client, batch_size=50, window=0.05, max_in_flight=4,
+                 requests_per_minute=30, request_timeout=120.0, verbose=False, model=DEFAULT_MODELS["groq"]):
+    """Creates the HTTP server with one micro-batcher per prompt kind sharing a cache."""
+    server = ThreadingHTTPServer((host, port), TranslationHandler)
+    server.daemon_threads = True
+    server.cache = TranslationCache()
+    # Requests per minute are split evenly between the batchers.
+    server.batchers = {
+        kind: MicroBatcher(
+            client, kind, server.cache,
+            batch_size=batch_size,
+            window=window,
+            max_in_flight=max_in_flight,
+            requests_per_minute=requests_per_minute / len(LINE_KINDS),
+            model=model,
+        )
+        for kind in LINE_KINDS
+    }
+    server.max_request_items = batch_size
+    server.request_timeout = request_timeout
+    server.verbose = verbose
+    return server
+
+
+
+def serve(host="127.0.0.1", port=8765, provider="groq", model=None, **options):
+    """Starts the translation service and blocks until interrupted."""
+    from .transport import get_client
+
+    server = build_server(host, port, get_client(provider), model=model or DEFAULT_MODELS[provider], **options)
+    print(f"Translation server listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Shutting down.")
+        server.server_close()
@@ -1,6 +1,5 @@
 import os
 import pandas as pd
-import re
 
 # --- Step 1: Create a Function to Load the File (CSV or XLSX) ---
 def load_file(filename, text_column='Skill'):
@@ -59,17 +58,3 @@ def process_file(filename, text_column='Skill'):
     print("Total letters:", total_letters)
     print("Total words:", total_words)
     return df
-
-# --- Example Usage ---
-
-# Process a CSV file.
-csv_filename = 'skills.csv'
-df_csv = process_file(csv_filename)
-
-# Process an Excel file.
-xlsx_filename = 'jobs.xlsx'
-df_xlsx = process_file(xlsx_filename, text_column='Job Titles_En')
-
-# Optionally, you can save the processed DataFrame with the new columns to a new file.
-# df_csv.to_csv('processed_skills_csv.csv', index=False)
-# df_xlsx.to_excel('processed_skills_xlsx.xlsx', index=False)
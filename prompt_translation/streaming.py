@@ -0,0 +1,280 @@
+import json
+from collections import deque
+
+from .profiling import StageTimer
+
+# --- Incremental parsers for streamed completions ---
+# Both parsers accept arbitrary text fragments through feed() and return the
+# (source, translation) pairs that became complete with that fragment, so
+# items can be committed while the rest of the response is still arriving.
+
+
+def parse_translation_line(line):
+    """
+    Parses a single 'English Title: Turkish Title' line.
+    Returns a (source, translation) tuple or None if the line has no ':'.
+    """
+    if ":" not in line:
+        return None
+    source, translation = line.split(":", 1)
+    source = source.strip()
+    translation = translation.strip()
+    # Remove any numbering if present (e.g., "1. Software Engineer")
+    if ". " in source:
+        source = source.split(". ", 1)[1]
+    return source, translation
+
+
+class LineItemParser:
+    """Parses the line-per-item 'Source: Translation' response format incrementally."""
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, text):
+        self.buffer += text
+        items = []
+        while "\n" in self.buffer:
+            line, self.buffer = self.buffer.split("\n", 1)
+            item = parse_translation_line(line)
+            if item:
+                items.append(item)
+        return items
+
+    def close(self, truncated=False):
+        """
+        Flushes the last line. If the stream was cut off, the unterminated
+        line may hold a half-written translation and is dropped.
+        """
+        line, self.buffer = self.buffer, ""
+        if truncated:
+            return []
+        item = parse_translation_line(line)
+        return [item] if item else []
+
+
+class JsonMemberParser:
+    """
+    Parses the members of a single top-level JSON object incrementally.
+    Any text before the first '{' (e.g. a ```json fence) is ignored.
+    """
+
+    WHITESPACE = " \t\r\n"
+
+    def __init__(self):
+        self.buffer = ""
+        self.started = False
+        self.done = False
+        self._decoder = json.JSONDecoder()
+
+    def feed(self, text):
+        self.buffer += text
+        return self._drain(final=False)
+
+    def close(self, truncated=False):
+        return self._drain(final=not truncated)
+
+    def _skip(self, i, chars):
+        while i < len(self.buffer) and self.buffer[i] in chars:
+            i += 1
+        return i
+
+    def _drain(self, final):
+        items = []
+        buf = self.buffer
+        pos = 0
+        if not self.started:
+            start = buf.find("{")
+            if start == -1:
+                self.buffer = ""
+                return items
+            pos = start + 1
+            self.started = True
+        while not self.done:
+            i = self._skip(pos, self.WHITESPACE + ",")
+            if i >= len(buf):
+                break
+            if buf[i] == "}":
+                self.done = True
+                pos = i + 1
+                break
+            if buf[i] != '"':
+                # Not a member key: the model went off format, stop parsing.
+                self.done = True
+                break
+            try:
+                key, j = self._decoder.raw_decode(buf, i)
+            except json.JSONDecodeError:
+                break  # key not complete yet
+            j = self._skip(j, self.WHITESPACE)
+            if j >= len(buf):
+                break
+            if buf[j] != ":":
+                self.done = True
+                break
+            j = self._skip(j + 1, self.WHITESPACE)
+            if j >= len(buf):
+                break
+            try:
+                value, k = self._decoder.raw_decode(buf, j)
+            except json.JSONDecodeError:
+                break  # value not complete yet
+            # A bare number/literal at the end of the buffer may still be growing.
+            if buf[j] not in '"{[' and k >= len(buf) and not final:
+                break
+            items.append((key, value))
+            pos = k
+        self.buffer = buf[pos:]
+        return items
+
+
+# --- Streaming request helper ---
+def stream_translations(client, parser, expected_keys=(), on_item=None, on_missing=None, cancel=None, on_stream=None,
+                        **request_kwargs):
+    """
+    Sends a streaming chat completion and feeds the deltas to `parser`.
+
+    Every completed item is passed to `on_item(source, translation)` as soon as
+    it is parsed; if on_item returns False the item is rejected and counts as
+    unanswered. Items from `expected_keys` are reported to `on_missing(key)`
+    as soon as the model has moved past them without answering, and any that
+    are still unanswered when the stream ends (or is cut off) are reported then.
+
+    Returns a (translations_dict, finish_reason) tuple; finish_reason is
+    "error" if the request failed, in which case everything already received
+    is kept. If the `cancel` event gets set, the stream is closed and
+    finish_reason is "cancelled". on_stream(stream) gets the stream object as
+    soon as it is opened, so another thread can close a stalled stream.
+    """
+    order = list(expected_keys)
+    pending = {}
+    for pos, key in enumerate(order):
+        pending.setdefault(key, pos)
+    cursor = 0
+    translations = {}
+    finish_reason = None
+    parsing = StageTimer("parse")
+
+    def commit(items):
+        nonlocal cursor
+        for source, translation in items:
+            if on_item and on_item(source, translation) is False:
+                continue
+            translations[source] = translation
+            pos = pending.pop(source, None)
+            if pos is None:
+                continue
+            # The response follows the prompt order, so earlier keys that are
+            # still pending were skipped by the model.
+            for skipped in order[cursor:pos]:
+                if skipped in pending:
+                    del pending[skipped]
+                    if on_missing:
+                        on_missing(skipped)
+            cursor = max(cursor, pos + 1)
+
+    # Only the request and the stream are guarded: an exception raised by
+    # on_item/on_missing is a caller bug, not a failed request, and propagates.
+    stream = None
+    try:
+        stream = client.chat.completions.create(stream=True, **request_kwargs)
+        if on_stream:
+            on_stream(stream)
+        events = iter(stream)
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        finish_reason = "error"
+        events = iter(())
+
+    while True:
+        if cancel is not None and cancel.is_set():
+            finish_reason = "cancelled"
+            if hasattr(stream, "close"):
+                stream.close()
+            break
+        try:
+            event = next(events, None)
+        except Exception as e:
+            if cancel is not None and cancel.is_set():
+                # Closed from another thread while waiting for the next event
+                finish_reason = "cancelled"
+                break
+            print(f"An error occurred: {e}")
+            finish_reason = "error"
+            break
+        if event is None:
+            break
+        if not event.choices:
+            continue
+        choice = event.choices[0]
+        if choice.delta and choice.delta.content:
+            with parsing:
+                items = parser.feed(choice.delta.content)
+            commit(items)
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+
+    with parsing:
+        items = parser.close(truncated=finish_reason != "stop")
+    commit(items)
+    parsing.flush(items=len(translations))
+    if finish_reason == "length":
+        print(f"Warning: response truncated at the token limit; kept {len(translations)} items.")
+    for key in list(pending):
+        del pending[key]
+        if on_missing:
+            on_missing(key)
+    return translations, finish_reason
+
+
+# --- Chunk queue with retry scheduling ---
+class ChunkQueue:
+    """
+    Queue of chunks to translate. `chunks` may be a lazy iterator; it is only
+    advanced when the next chunk is needed. Items reported missing during a
+    request are re-queued as a new chunk right after it, up to `max_attempts`
+    per item.
+    """
+
+    def __init__(self, chunks, key=None, max_attempts=3):
+        self.total = len(chunks) if hasattr(chunks, "__len__") else None
+        self._source = iter(chunks)
+        self._chunks = deque()
+        self._key = key or (lambda item: item)
+        self._items = {}
+        self._attempts = {}
+        self._retry = []
+        self.max_attempts = max_attempts
+
+    def __iter__(self):
+        while True:
+            if self._retry:
+                self._chunks.append(self._retry)
+                self._retry = []
+                if self.total is not None:
+                    self.total += 1
+            if self._chunks:
+                yield self._chunks.popleft()
+                continue
+            chunk = next(self._source, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    def keys(self, chunk):
+        """Returns the keys expected back for `chunk` and remembers their items."""
+        # Only the chunk being translated can report missing items.
+        self._items = {}
+        keys = []
+        for item in chunk:
+            key = self._key(item)
+            self._items[key] = item
+            keys.append(key)
+        return keys
+
+    def report_missing(self, key):
+        attempts = self._attempts[key] = self._attempts.get(key, 0) + 1
+        if attempts < self.max_attempts:
+            self._retry.append(self._items[key])
+        else:
+            print(f"Giving up on {key!r} after {attempts} attempts.")
@@ -0,0 +1,201 @@
+import csv
+import os
+import time
+
+import pandas as pd
+
+from .engine import chunk_list, translate_chunks
+from .profiling import span
+from .segmentation import SegmentedCells, pack_segments
+
+# Column names, chunk size and request interval used for each kind when not given
+TABLE_DEFAULTS = {
+    "skills": {"column": "Skill", "target_column": "Turkce_Skill", "chunk_size": 150, "interval": 5.0},
+    "jobs": {"column": "Job Titles_En", "target_column": "Turkce_Meslek", "chunk_size": 50, "interval": 2.0},
+    "descriptions": {"column": "Description", "target_column": "Turkce_Aciklama", "chunk_size": 40, "interval": 5.0},
+}
+
+# Kinds whose cells are split into sentences, translated as (id, sentence) pairs and reassembled
+SEGMENTED_KINDS = ("descriptions",)
+
+
+def read_table(filename):
+    """Reads a CSV or Excel file into a DataFrame based on its extension."""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == ".csv":
+        return pd.read_csv(filename)
+    if ext in [".xls", ".xlsx"]:
+        return pd.read_excel(filename)
+    raise ValueError("Unsupported file format: " + ext)
+
+
+def _row_key(row):
+    """Row values as a hashable key; anything that is not text (NaN, numbers) becomes None and is not translated."""
+    return tuple(value if isinstance(value, str) else None for value in row)
+
+
+def _has_fields(translation, columns, row):
+    """Whether a row translation is an object with every field the row was sent with."""
+    return isinstance(translation, dict) and all(
+        name in translation for name, value in zip(columns, row) if value is not None
+    )
+
+
+def _translated_letters(translation):
+    if isinstance(translation, dict):
+        return sum(len(text) for text in translation.values() if isinstance(text, str))
+    return len(translation) if isinstance(translation, str) else 0
+
+
+def translate_table(input_filename, output_filename, kind="skills", column=None, target_column=None,
+                    chunk_size=None, interval=None, provider="groq", model=None,
+                    checkpoint=False, progress_filename=None, batch_options=None, scheduler=None,
+                    hedge_options=None, cascade_options=None, columns=None, target_columns=None):
+    """
+    Translates one column of a CSV/Excel table and writes the table, with the
+    translations in `target_column`, to `output_filename` as CSV.
+
+    With several `columns` the fields of each row are sent together as one
+    item (with the "rows-<kind>" prompt) and written to `target_columns`, by
+    default "Turkce_<column>"; chunk_size then counts rows. Rows whose answer
+    lacks any of their fields are retried like skipped items. Segmented kinds
+    ("descriptions") translate one column at a time.
+
+    With `checkpoint` the output CSV is rewritten after every chunk; with
+    `progress_filename` every translation is also appended to that CSV the
+    moment it streams in. `batch_options` switches to the offline batch API;
+    `scheduler` runs the requests as a job of a shared FairScheduler;
+    `hedge_options` duplicates slow requests to a second model or endpoint;
+    `cascade_options` tries a small model first and escalates failed items.
+    """
+    defaults = TABLE_DEFAULTS[kind]
+    if columns and (column or target_column):
+        raise ValueError("Use either column/target_column or columns/target_columns, not both")
+    if target_columns and not columns:
+        raise ValueError("target_columns needs columns")
+    columns = list(columns) if columns else [column or defaults["column"]]
+    row_mode = len(columns) > 1
+    if row_mode and kind in SEGMENTED_KINDS:
+        raise ValueError(f"--kind {kind} splits cells into sentences and translates one column at a time, not --columns")
+    if target_columns:
+        target_columns = list(target_columns)
+    elif row_mode:
+        target_columns = [f"Turkce_{name}" for name in columns]
+    else:
+        target_columns = [target_column or defaults["target_column"]]
+    if len(target_columns) != len(columns):
+        raise ValueError(f"Got {len(columns)} columns but {len(target_columns)} target columns")
+    column, target_column = columns[0], target_columns[0]
+    if chunk_size is None:
+        # Keep requests about as large as with one column per item.
+        chunk_size = max(1, defaults["chunk_size"] // len(columns))
+    interval = defaults["interval"] if interval is None else interval
+
+    # --- Step 1: Read the File ---
+    with span("read", file=input_filename):
+        df = read_table(input_filename)
+    for name in columns:
+        if name not in df.columns:
+            raise ValueError(f"Column '{name}' not found in {input_filename}!")
+    # Translations are mapped back by value, so every distinct item is sent once.
+    with span("dedup"):
+        if row_mode:
+            row_keys = [_row_key(row) for row in df[columns].itertuples(index=False, name=None)]
+            items = list(dict.fromkeys(row_keys))
+        else:
+            items = list(dict.fromkeys(df[column].tolist()))
+
+    # --- Step 2: Split the Items into Chunks ---
+    segmented = None
+    with span("chunk"):
+        if row_mode:
+            # One item per distinct row: ("r1", {"Title": ..., "Category": ...})
+            row_ids = {row: f"r{i}" for i, row in enumerate(items, start=1)}
+            rows = {row_ids[row]: row for row in items}
+            pairs = [
+                (row_ids[row], {name: value for name, value in zip(columns, row) if value is not None})
+                for row in items if any(value is not None for value in row)
+            ]
+            chunks = list(chunk_list(pairs, chunk_size))
+        elif kind in SEGMENTED_KINDS:
+            # Long cells become sentences; repeated sentences are sent once.
+            segmented = SegmentedCells(items)
+            chunks = list(pack_segments(segmented.pairs(), chunk_size))
+        else:
+            chunks = list(chunk_list(items, chunk_size))
+    if row_mode:
+        print(f"Total chunks: {len(chunks)} ({len(pairs)} distinct rows, {len(columns)} columns each)")
+    elif segmented:
+        print(f"Total chunks: {len(chunks)} ({len(segmented)} distinct segments in {len(items)} cells)")
+    else:
+        print(f"Total chunks: {len(chunks)}")
+
+    # --- Step 3: Commit Each Streamed Translation ---
+    translations_all = {}
+    progress_file = open(progress_filename, "a", newline="", encoding="utf-8") if progress_filename else None
+    progress_writer = csv.writer(progress_file) if progress_file else None
+
+    def commit_translation(source, translation):
+        # Ids the model made up ("S1", "r0") are ignored.
+        if row_mode and source not in rows:
+            return
+        if row_mode and not _has_fields(translation, columns, rows[source]):
+            return False
+        if segmented and source not in segmented:
+            return
+        translations_all[source] = translation
+        if progress_writer:
+            if row_mode:
+                progress_writer.writerow([*rows[source], *(translation.get(name) for name in columns)])
+            else:
+                progress_writer.writerow([segmented.text(source) if segmented else source, translation])
+            progress_file.flush()
+
+    def apply_translations():
+        if row_mode:
+            row_translations = [translations_all.get(row_ids[key], {}) for key in row_keys]
+            for name, target in zip(columns, target_columns):
+                df[target] = [translation.get(name) for translation in row_translations]
+        elif segmented:
+            df[target_column] = df[column].map(dict(zip(items, segmented.reassemble(translations_all))))
+        else:
+            df[target_column] = df[column].map(translations_all)
+
+    def save_checkpoint(idx):
+        with span("merge", chunk=idx):
+            apply_translations()
+        with span("write", chunk=idx):
+            df.to_csv(output_filename, index=False)
+        print(f"Updated CSV saved after chunk {idx} in {output_filename}")
+
+    # --- Step 4: Translate Every Chunk with Rate Limiting ---
+    overall_start_time = time.time()
+    try:
+        translate_chunks(
+            chunks, f"rows-{kind}" if row_mode else kind, commit_translation,
+            provider=provider,
+            model=model,
+            interval=interval,
+            on_chunk_done=save_checkpoint if checkpoint else None,
+            batch_options=batch_options,
+            scheduler=scheduler,
+            hedge_options=hedge_options,
+            cascade_options=cascade_options,
+        )
+    finally:
+        if progress_file:
+            progress_file.close()
+
+    # --- Step 5: Merge the Translations with the Original Data and Save ---
+    with span("merge"):
+        apply_translations()
+    with span("write", file=output_filename):
+        df.to_csv(output_filename, index=False)
+
+    total_time = time.time() - overall_start_time
+    total_letters = sum(_translated_letters(tr) for tr in translations_all.values())
+    print(f"\nTüm çeviri işlemi tamamlandı.")
+    print(f"Toplam süre: {total_time:.2f} saniye")
+    print(f"Toplamda çevrilen harf sayısı: {total_letters}")
+    print(f"Translations saved successfully in {output_filename}")
+    return df
@@ -0,0 +1,113 @@
+import os
+import atexit
+import httpx
+
+# --- Transport Settings (shared by every provider client) ---
+# A single pooled connection set is reused by all translation jobs, so TLS
+# handshakes happen once per host instead of once per request.
+POOL_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("TRANSLATION_MAX_CONNECTIONS", "64")),
+    max_keepalive_connections=int(os.getenv("TRANSLATION_MAX_KEEPALIVE", "32")),
+    keepalive_expiry=120.0,  # keep idle connections open between chunks / rate-limit sleeps
+)
+TIMEOUTS = httpx.Timeout(
+    float(os.getenv("TRANSLATION_READ_TIMEOUT", "120")),  # long completions can take a while
+    connect=10.0,
+    pool=30.0,
+)
+# HTTP/2 multiplexes concurrent requests over one connection per host.
+USE_HTTP2 = os.getenv("TRANSLATION_HTTP2", "1") != "0"
+# Ask for compressed response bodies (httpx decodes them transparently).
+DEFAULT_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+# Model used by each provider when none is given
+DEFAULT_MODELS = {
+    "groq": "meta-llama/llama-4-maverick-17b-128e-instruct",
+    "openrouter": "openrouter/optimus-alpha",
+}
+
+# Small, fast models used for the first pass of the cascade mode
+SMALL_MODELS = {
+    "groq": "llama-3.1-8b-instant",
+    "openrouter": "meta-llama/llama-3.1-8b-instruct",
+}
+
+_http_client = None
+_provider_clients = {}
+
+
+def _load_env():
+    # Imported here so commands that never talk to a provider don't pay for it.
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def get_http_client():
+    """
+    Returns the process-wide pooled httpx client, creating it on first use.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            http2=USE_HTTP2,
+            limits=POOL_LIMITS,
+            timeout=TIMEOUTS,
+            headers=DEFAULT_HEADERS,
+        )
+    return _http_client
+
+
+def get_groq_client():
+    """
+    Returns a Groq client that sends its requests over the shared transport.
+    """
+    if "groq" not in _provider_clients:
+        from groq import Groq
+        _load_env()
+        _provider_clients["groq"] = Groq(
+            api_key=os.getenv("GROQ_API_KEY"),
+            http_client=get_http_client(),
+        )
+    return _provider_clients["groq"]
+
+
+def get_openrouter_client():
+    """
+    Returns an OpenAI-compatible OpenRouter client that sends its requests over the shared transport.
+    """
+    if "openrouter" not in _provider_clients:
+        from openai import OpenAI
+        _load_env()
+        _provider_clients["openrouter"] = OpenAI(
+            base_url=OPENROUTER_BASE_URL,
+            api_key=os.environ["OPENROUTER_API_KEY"],
+            http_client=get_http_client(),
+        )
+    return _provider_clients["openrouter"]
+
+
+PROVIDERS = {
+    "groq": get_groq_client,
+    "openrouter": get_openrouter_client,
+}
+
+
+def get_client(provider="groq"):
+    """Returns the shared client for `provider` ("groq" or "openrouter")."""
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown provider '{provider}', expected one of {sorted(PROVIDERS)}")
+    return PROVIDERS[provider]()
+
+
+def close_transport():
+    """Closes the pooled connections; registered to run at interpreter exit."""
+    global _http_client
+    _provider_clients.clear()
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+
+
+atexit.register(close_transport)
@@ -0,0 +1,193 @@
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from prompt_translation.json_stream import JsonEventReader, JsonEventWriter
+from prompt_translation.segmentation import SegmentedCells, split_segments
+from prompt_translation.streaming import ChunkQueue, JsonMemberParser, LineItemParser, stream_translations
+
+DOCUMENT = {
+    "nav.home": "Home",
+    "nav": {"settings.title": "Settings", "count": 12345, "ratio": -0.125, "flags": [True, False, None]},
+    "quote": "She said \"hi\" \\ ok",
+    "unicode": "Çalışma ☃",
+    "empty": {},
+    "list": [1, [2, []], {"a.b": "c"}],
+    "last": 7,
+}
+
+
+def fake_client(text, finish_reason="stop", piece=5):
+    """A client whose streamed completion delivers `text` in `piece`-sized deltas."""
+
+    def create(stream=True, **kwargs):
+        events = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text[i:i + piece]), finish_reason=None)])
+            for i in range(0, len(text), piece)
+        ]
+        events.append(SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None), finish_reason=finish_reason)]))
+        return iter(events)
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+# --- JSON Event Reader/Writer ---
+@pytest.mark.parametrize("block_size", [1, 2, 3, 5, 7, 64])
+def test_json_events_round_trip(block_size):
+    source = json.dumps(DOCUMENT, indent=2, ensure_ascii=False)
+    out = io.StringIO()
+    writer = JsonEventWriter(out)
+    for event, value in JsonEventReader(io.StringIO(source), block_size=block_size):
+        writer.event(event, value)
+    assert out.getvalue() == source
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 4])
+def test_json_reader_keeps_scalars_split_across_blocks(block_size):
+    source = '{"a.b":123456,"c":true,"d":null,"e":[1.5e3,"x"]}'
+    assert list(JsonEventReader(io.StringIO(source), block_size=block_size)) == [
+        ("start_map", None),
+        ("key", "a.b"), ("value", 123456),
+        ("key", "c"), ("value", True),
+        ("key", "d"), ("value", None),
+        ("key", "e"), ("start_array", None), ("value", 1.5e3), ("value", "x"), ("end_array", None),
+        ("end_map", None),
+    ]
+
+
+def test_json_reader_events_at_every_block_size():
+    source = json.dumps(DOCUMENT)
+    expected = list(JsonEventReader(io.StringIO(source), block_size=len(source) + 1))
+    for block_size in range(1, 12):
+        assert list(JsonEventReader(io.StringIO(source), block_size=block_size)) == expected
+
+
+# --- Response Parsers ---
+def test_line_item_parser_split_anywhere():
+    text = "1. cooking: yemek pişirme\n2. Sales & Marketing: Satış ve Pazarlama\n3. C++: C++\n"
+    for cut in range(len(text) + 1):
+        parser = LineItemParser()
+        items = parser.feed(text[:cut]) + parser.feed(text[cut:]) + parser.close()
+        assert items == [("cooking", "yemek pişirme"), ("Sales & Marketing", "Satış ve Pazarlama"), ("C++", "C++")]
+
+
+def test_line_item_parser_drops_unterminated_line_when_truncated():
+    parser = LineItemParser()
+    items = parser.feed("cooking: yemek pişirme\nbaking: fırın") + parser.close(truncated=True)
+    assert items == [("cooking", "yemek pişirme")]
+
+    parser = LineItemParser()
+    items = parser.feed("cooking: yemek pişirme\nbaking: fırıncılık") + parser.close()
+    assert items == [("cooking", "yemek pişirme"), ("baking", "fırıncılık")]
+
+
+def test_json_member_parser_split_anywhere():
+    text = '```json\n{"s1": "Bir.", "r2": {"Title": "Aşçı", "Category": "Gıda"}, "n": 42}\n```'
+    expected = [("s1", "Bir."), ("r2", {"Title": "Aşçı", "Category": "Gıda"}), ("n", 42)]
+    for cut in range(len(text) + 1):
+        parser = JsonMemberParser()
+        assert parser.feed(text[:cut]) + parser.feed(text[cut:]) + parser.close() == expected
+
+
+def test_json_member_parser_truncated():
+    parser = JsonMemberParser()
+    assert parser.feed('{"a": "bir", "b": "ik') == [("a", "bir")]
+    assert parser.close(truncated=True) == []
+
+    # A bare number at the end may still be growing, so it only counts on a clean finish.
+    parser = JsonMemberParser()
+    assert parser.feed('{"a": "bir", "n": 12') == [("a", "bir")]
+    assert parser.close(truncated=True) == []
+    parser = JsonMemberParser()
+    parser.feed('{"a": "bir", "n": 12')
+    assert parser.close() == [("n", 12)]
+
+
+# --- Chunk Queue ---
+def test_chunk_queue_requeues_then_gives_up(capsys):
+    queue = ChunkQueue([["a", "b"], ["c"]], max_attempts=2)
+    seen = []
+    for chunk in queue:
+        seen.append(chunk)
+        queue.keys(chunk)
+        if "b" in chunk:
+            queue.report_missing("b")
+    assert seen == [["a", "b"], ["b"], ["c"]]
+    assert queue.total == 3
+    assert "Giving up on 'b' after 2 attempts." in capsys.readouterr().out
+
+
+def test_chunk_queue_lazy_source_with_pair_keys():
+    queue = ChunkQueue(iter([[("k1", "x"), ("k2", "y")]]), key=lambda pair: pair[0], max_attempts=3)
+    seen = []
+    for chunk in queue:
+        seen.append(chunk)
+        if queue.keys(chunk) == ["k1", "k2"]:
+            queue.report_missing("k2")
+    assert seen == [[("k1", "x"), ("k2", "y")], [("k2", "y")]]
+    assert queue.total is None
+
+
+# --- stream_translations ---
+def test_stream_translations_reports_skipped_and_rejected_items():
+    client = fake_client("a: A\nc: C\nd: \n")
+    items, missing = [], []
+
+    def on_item(source, translation):
+        if not translation:
+            return False
+        items.append((source, translation))
+
+    translations, finish_reason = stream_translations(
+        client, LineItemParser(), expected_keys=["a", "b", "c", "d"], on_item=on_item, on_missing=missing.append
+    )
+    assert finish_reason == "stop"
+    assert items == [("a", "A"), ("c", "C")]
+    assert missing == ["b", "d"]
+    assert translations == {"a": "A", "c": "C"}
+
+
+def test_stream_translations_drops_half_line_at_token_limit():
+    client = fake_client("a: A\nb: yarım", finish_reason="length")
+    missing = []
+    translations, finish_reason = stream_translations(
+        client, LineItemParser(), expected_keys=["a", "b"], on_missing=missing.append
+    )
+    assert finish_reason == "length"
+    assert translations == {"a": "A"}
+    assert missing == ["b"]
+
+
+# --- Sentence Segmentation ---
+def test_split_segments_round_trips_spacing():
+    text = "  First sentence here.  Second one!\n\nThird  with   spaces " + "x" * 30 + " https://example.com/" + "y" * 50 + " end. "
+    segments, separators = split_segments(text, threshold=10, max_chars=25)
+    assert all(0 < len(segment) <= 25 for segment in segments)
+    rebuilt = separators[0] + "".join(segment + separator for segment, separator in zip(segments, separators[1:]))
+    assert rebuilt == text
+
+
+def test_segmented_cells_reassemble():
+    boilerplate = "We offer a competitive salary and a friendly team in the city centre."
+    cells = [
+        f"Cook wanted for a busy restaurant kitchen with long opening hours. {boilerplate}",
+        f"Cashier needed for weekend shifts at our largest store on the high street. {boilerplate}",
+        "Short cell.",
+        None,
+    ]
+    segmented = SegmentedCells(cells, threshold=40)
+    texts = [text for _, text in segmented.pairs()]
+    assert texts.count(boilerplate) == 1
+    assert len(segmented) == 4
+
+    translations = {segment_id: text.upper() for segment_id, text in segmented.pairs()}
+    assert segmented.reassemble(translations) == [
+        cells[0].upper(), cells[1].upper(), "SHORT CELL.", None,
+    ]
+
+    missing_one = dict(translations)
+    del missing_one[segmented.pairs()[0][0]]
+    assert segmented.reassemble(missing_one)[0] is None
+    assert "S1" not in segmented